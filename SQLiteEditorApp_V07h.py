@@ -1,31 +1,136 @@
 import sys
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
                             QLabel, QPushButton, QFileDialog, QMessageBox, QComboBox, QLineEdit,
-                            QCheckBox, QTreeWidget, QTreeWidgetItem, QTableWidget, QTableWidgetItem,
+                            QCheckBox, QTreeWidget, QTreeWidgetItem, QTableView,
                             QInputDialog, QTextEdit, QHeaderView, QSpinBox, QProgressDialog)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QTextCursor, QTextCharFormat, QColor
+from PyQt6.QtCore import (Qt, QTimer, QThread, QObject, pyqtSignal, QAbstractTableModel, QModelIndex, QSignalBlocker,
+                          QRunnable, QThreadPool)
+from PyQt6.QtGui import QAction, QTextCursor, QTextCharFormat, QTextTableFormat, QColor, QFont
 from PyQt6.QtPrintSupport import QPrinter, QPrintPreviewDialog, QPrintDialog
 from PyQt6.QtGui import QTextDocument
 import sqlite3
 import csv
 import os
+import re
 import logging
+import threading
 import time
+from contextlib import contextmanager, ExitStack
+from functools import lru_cache
+from itertools import islice
 
 logging.basicConfig(level=logging.DEBUG, filename='SQLite_Edit.log', filemode='w',
                     format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# One column definition inside CREATE TABLE (...): the identifier, then everything up to the next top-level comma
+_COLNAME_RE = re.compile(r'\s*(?:"(?P<quoted>(?:[^"]|"")+)"|(?P<bare>\w+))')
+
+# A table constraint (not a column) at the start of a CREATE TABLE definition, optionally named
+_TABLE_CONSTRAINT_RE = re.compile(r'\s*(?:CONSTRAINT\s+(?:"(?:[^"]|"")+"|\w+)\s+)?'
+                                  r'(?P<kind>PRIMARY\s+KEY|UNIQUE|CHECK|FOREIGN\s+KEY)\b', re.IGNORECASE)
+
+# Statements that change the schema and so invalidate DatabaseManager's cached metadata
+_DDL_RE = re.compile(r"\s*(CREATE|DROP|ALTER)\b", re.IGNORECASE)
+
+# Statements that write, and so should take the write lock with BEGIN IMMEDIATE before they run
+_WRITE_RE = re.compile(r"\s*(INSERT|UPDATE|DELETE|REPLACE|CREATE|DROP|ALTER)\b", re.IGNORECASE)
+
+# ALTER TABLE ... DROP COLUMN needs SQLite 3.35 (RENAME COLUMN arrived in 3.25)
+_NATIVE_ALTER = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Shared check-mark text for the flag columns of the field tree
+_CHECK = "✓"
+
+# Characters SchemaEditor.new_table refuses in a table name
+_FORBIDDEN_NAME_CHARS = frozenset(';"\'')
+
+def quote_ident(name):
+    """Quote a table or column name for SQL text; embedded double quotes are doubled."""
+    return '"' + name.replace('"', '""') + '"'
+
+@lru_cache(maxsize=512)
+def parse_type(type_text):
+    """Split a declared type such as VARCHAR(40) into (base, length); length is "" without parentheses."""
+    start = type_text.find("(")
+    if start < 0:
+        return type_text, ""
+    end = type_text.find(")", start + 1)
+    return type_text[:start], type_text[start + 1:end if end >= 0 else len(type_text)]
+
+def _split_definitions(body):
+    """Split a CREATE TABLE body at its top-level commas, up to the closing parenthesis.
+
+    Nested parentheses (e.g. CHECK (length(x) > 0)) and quoted text are skipped over, so their commas do not split.
+    """
+    parts, start, depth, quote = [], 0, 0, None
+    for i, ch in enumerate(body):
+        if quote:
+            if ch == quote:
+                quote = None  # A doubled quote closes and reopens, which comes to the same thing
+        elif ch in "'\"`[":
+            quote = "]" if ch == "[" else ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            if depth == 0:
+                break
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(body[start:i])
+            start = i + 1
+    else:
+        i = len(body)
+    parts.append(body[start:i])
+    return parts
+
+def _column_name(match):
+    return match["quoted"].replace('""', '"') if match["quoted"] is not None else match["bare"]
+
+def parse_column_flags(create_sql):
+    """Map each column of a CREATE TABLE statement to its (autoincrement, unique) flags.
+
+    Table constraints count too: PRIMARY KEY("id" AUTOINCREMENT) flags id, and a single-column UNIQUE("email")
+    flags email (a multi-column UNIQUE makes none of its columns unique on its own).
+    """
+    flags = {}
+    for definition in _split_definitions(create_sql[create_sql.find("(") + 1:]):
+        constraint = _TABLE_CONSTRAINT_RE.match(definition)
+        if constraint:
+            kind = constraint["kind"].upper()
+            start = definition.find("(", constraint.end())
+            if kind in ("CHECK", "FOREIGN KEY") or start < 0:
+                continue
+            columns = [_column_name(m) for part in _split_definitions(definition[start + 1:])
+                       if (m := _COLNAME_RE.match(part))]
+            autoincrement = kind == "PRIMARY KEY" and "AUTOINCREMENT" in definition.upper()
+            unique = kind == "UNIQUE" and len(columns) == 1
+            for name in columns:
+                auto_flag, unique_flag = flags.get(name, (False, False))
+                flags[name] = (auto_flag or autoincrement, unique_flag or unique)
+            continue
+        m = _COLNAME_RE.match(definition)
+        if not m:
+            continue
+        name = _column_name(m)
+        rest = definition[m.end():].upper()
+        auto_flag, unique_flag = flags.get(name, (False, False))
+        flags[name] = (auto_flag or "AUTOINCREMENT" in rest, unique_flag or "UNIQUE" in rest)
+    return flags
 
 # ----------------------
-# TableReport (HTML-based report for QPrinter)
+# TableReport (QTextDocument-based report for QPrinter)
 # ----------------------
 class TableReport:
-    """Build a simple HTML table from a QTableWidget page and send it to either a QPrintPreviewDialog or to an actual printer."""
-    def __init__(self, qtable, title="Table Report"):
-        self.table = qtable
+    """Write a table model page into a QTextDocument table and send it to either a QPrintPreviewDialog or to an actual printer."""
+    def __init__(self, model, title="Table Report"):
+        self.model = model
         self.title = title
+        self._doc = None  # Built once, then reused for every paintRequested of the preview
 
-    def preview(self, parent=None):
+    def preview(self, parent=None, doc=None):
+        if doc is not None:
+            self._doc = doc
         if not self._is_valid_table():
             QMessageBox.warning(parent, "Warning", "No data available for preview.")
             return
@@ -35,7 +140,9 @@ class TableReport:
         preview.paintRequested.connect(lambda p: self._render(p))
         preview.exec()
 
-    def print_(self, parent=None):
+    def print_(self, parent=None, doc=None):
+        if doc is not None:
+            self._doc = doc
         if not self._is_valid_table():
             QMessageBox.warning(parent, "Warning", "No data available for printing.")
             return
@@ -46,44 +153,89 @@ class TableReport:
             self._render(printer)
 
     def _render(self, printer):
-        doc = QTextDocument()
-        html = self._build_html()
-        doc.setHtml(html)
-        doc.print(printer)
+        if self._doc is None:
+            self._doc = self._build_document()
+        self._doc.print(printer)
+
+    def snapshot(self):
+        """Header and cell texts of the model, taken on the GUI thread for build_document."""
+        headers = [str(self.model.headerData(c, Qt.Orientation.Horizontal) or "") for c in range(self.model.columnCount())]
+        return headers, self.model.display_rows()
 
-    def _build_html(self):
-        row_cnt = self.table.rowCount()
-        col_cnt = self.table.columnCount()
+    def _build_document(self):
+        return self.build_document(self.title, *self.snapshot())
+
+    @staticmethod
+    def build_document(title, headers, rows):
+        """Write the table straight into a QTextDocument through a QTextCursor (no HTML round-trip).
+
+        Touches no widgets or model, so ReportWorker can run it on the thread pool.
+        """
+        doc = QTextDocument()
+        doc.setUndoRedoEnabled(False)  # No undo stack entry per inserted cell
+        cursor = QTextCursor(doc)
+        title_fmt = QTextCharFormat()
+        title_fmt.setFontWeight(QFont.Weight.Bold)
+        title_fmt.setFontPointSize(14)
+        cursor.insertText(title, title_fmt)
+        cursor.insertBlock()
+        row_cnt = len(rows)
+        col_cnt = len(headers)
         if row_cnt == 0 or col_cnt == 0:
-            return "No Data\n"
-        header_cells = "".join(
-            f"	{self.table.horizontalHeaderItem(c).text()}\n"
-            for c in range(col_cnt) if self.table.horizontalHeaderItem(c)
-        )
-        body_rows = []
-        for r in range(row_cnt):
-            cells = []
-            for c in range(col_cnt):
-                item = self.table.item(r, c)
-                cells.append(f"	{item.text() if item else ''}\n")
-            body_rows.append(f"\n{''.join(cells)}")
-        body_html = "\n".join(body_rows)
-        return f"""
-\n\n
-    {self.title}\n\n
-    \n\n\n
-                {header_cells}
-            \n
-        \n\n
-            {body_html}
-        \n
-    \n
-"""
+            cursor.insertText("No Data")
+            return doc
+        table_fmt = QTextTableFormat()
+        table_fmt.setBorder(1)
+        table_fmt.setCellPadding(3)
+        table_fmt.setCellSpacing(0)
+        table_fmt.setHeaderRowCount(1)  # Repeat the header on every printed page
+        cursor.insertTable(row_cnt + 1, col_cnt, table_fmt)
+        header_fmt = QTextCharFormat()
+        header_fmt.setFontWeight(QFont.Weight.Bold)
+        cell_fmt = QTextCharFormat()
+        next_cell = QTextCursor.MoveOperation.NextCell
+        # Bound methods hoisted out of the rows x columns loop
+        insert_text, move = cursor.insertText, cursor.movePosition
+        for header in headers:
+            insert_text(header, header_fmt)
+            move(next_cell)
+        for row in rows:
+            for text in row:
+                if text:
+                    insert_text(text, cell_fmt)
+                move(next_cell)
+        return doc
 
     def _is_valid_table(self):
-        return (self.table and self.table.columnCount() > 0 and
-                self.table.rowCount() > 0 and
-                all(self.table.horizontalHeaderItem(c) for c in range(self.table.columnCount())))
+        return (self.model is not None and self.model.columnCount() > 0 and
+                self.model.rowCount() > 0)
+
+
+class ReportSignals(QObject):
+    """Lives on the GUI thread, so ReportWorker's results are delivered there."""
+    built = pyqtSignal(object)  # QTextDocument, already moved to the GUI thread
+    failed = pyqtSignal(str)  # Error message
+
+
+class ReportWorker(QRunnable):
+    """Builds a TableReport document from a snapshot on the thread pool; printing stays on the GUI thread."""
+
+    def __init__(self, title, headers, rows, signals):
+        super().__init__()
+        self.title = title
+        self.headers = headers
+        self.rows = rows
+        self.signals = signals
+
+    def run(self):
+        try:
+            doc = TableReport.build_document(self.title, self.headers, self.rows)
+            doc.moveToThread(self.signals.thread())
+        except Exception as e:
+            logger.error("Report build failed: %s", e)
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.built.emit(doc)
 
 # ----------------------
 # DatabaseManager
@@ -101,8 +253,19 @@ class DatabaseManager:
     def __init__(self):
         self.conn = None
         self.cursor = None
+        self.read_conn = None
         self.db_path = None
+        # Serializes writer use; re-entrant because transaction() blocks nest (an inner one joins the outer)
+        self._write_lock = threading.RLock()
         self.metadata_cache = {}
+        self._tables_cache = None
+        self._single_pk_index = None
+        # The single-PK index is built on the thread pool after each invalidation; see prefetch_single_pk_index
+        self.metadata_signals = MetadataSignals()
+        self.metadata_signals.loaded.connect(self._store_single_pk_index)
+        self._pk_index_loading = False
+        # NORMAL: under WAL a commit survives a crash of the app but may be lost on power failure; FULL fsyncs each
+        self.synchronous = "NORMAL"
 
     def connect(self, file_path):
         try:
@@ -110,60 +273,269 @@ class DatabaseManager:
                 self.close()
             if not os.path.exists(file_path):
                 open(file_path, 'a').close()
-            self.conn = sqlite3.connect(file_path)
+            # Metadata and paging queries are parameterized, so a larger cache keeps their compiled statements alive
+            self.conn = sqlite3.connect(file_path, cached_statements=256)
             self.conn.execute("PRAGMA journal_mode=WAL")
-            self.conn.execute("PRAGMA synchronous=NORMAL")
-            self.conn.execute("PRAGMA locking_mode=NORMAL")
-            self.conn.execute("PRAGMA busy_timeout=8000")
+            # Connection settings in one script rather than a statement call each
+            self.conn.executescript(f"""
+                PRAGMA synchronous={self.synchronous};
+                PRAGMA locking_mode=NORMAL;
+                PRAGMA busy_timeout=8000;
+                -- Larger page cache, mmap'd reads and in-memory temp b-trees for metadata scans and table backups
+                PRAGMA mmap_size=268435456;
+                PRAGMA cache_size=-65536;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA wal_autocheckpoint=1000;
+                PRAGMA journal_size_limit=10485760;  -- Truncate the WAL back to 10 MiB after checkpoints
+                PRAGMA foreign_keys=ON;  -- Enforce the FK rules the Schema Editor writes
+                PRAGMA analysis_limit=1000;  -- ANALYZE / optimize sample each index, even on big tables
+                PRAGMA trusted_schema=OFF;  -- Views/triggers in an opened file cannot call side-effecting functions
+            """)
+            try:
+                self.conn.execute("PRAGMA optimize=0x10002")  # Bring stale planner statistics up to date on open
+            except sqlite3.Error as e:
+                logger.warning("PRAGMA optimize failed: %s", e)
             self.cursor = self.conn.cursor()
+            # Read-only second connection for schema lookups; under WAL it is not blocked by a long write
+            self.read_conn = sqlite3.connect(f"file:{file_path}?mode=ro", uri=True,
+                                             check_same_thread=False, cached_statements=256)
+            self.read_conn.executescript("PRAGMA busy_timeout=8000; PRAGMA mmap_size=268435456; PRAGMA trusted_schema=OFF;")
             self.db_path = file_path
-            self.metadata_cache.clear()
-            logging.info(f"Connected to database: {file_path}")
+            self.invalidate_metadata()
+            logger.info("Connected to database: %s", file_path)
             return True
         except sqlite3.Error as e:
-            logging.error(f"Failed to connect to database: {str(e)}")
+            logger.error("Failed to connect to database: %s", e)
             return False
 
     def close(self):
+        if self.read_conn:
+            self.read_conn.close()
+            self.read_conn = None
         if self.conn:
+            try:
+                self.conn.execute("PRAGMA optimize")  # Refresh planner statistics gathered this session
+            except sqlite3.Error as e:
+                logger.warning("PRAGMA optimize failed: %s", e)
             self.conn.close()
             self.conn = None
             self.cursor = None
             self.db_path = None
-            self.metadata_cache.clear()
-            logging.info("Database connection closed")
+            self.invalidate_metadata()
+            logger.info("Database connection closed")
 
     def is_connected(self):
         return self.conn is not None
 
+    def set_synchronous(self, full):
+        """Switch between FULL (fsync on every commit) and NORMAL durability; worker connections pick it up too."""
+        self.synchronous = "FULL" if full else "NORMAL"
+        if self.conn:
+            self.conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        logger.info("synchronous=%s", self.synchronous)
+
+    def _check_schema_version(self):
+        """Drop the metadata caches if the schema changed since they were filled, e.g. DDL from another process."""
+        version = self.read_conn.execute("PRAGMA schema_version").fetchone()[0]
+        if version != self._schema_version:
+            self.invalidate_metadata()
+            self._schema_version = version
+
     def get_tables(self):
         if self.is_connected():
-            self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0].strip() for row in self.cursor.fetchall()]
-            logging.info(f"Retrieved tables: {tables}")
-            return tables
+            self._check_schema_version()
+            if self._tables_cache is None:
+                # sqlite_sequence and other internal tables are not user data
+                rows = self.read_conn.execute("SELECT name FROM sqlite_master "
+                                              "WHERE type='table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\'").fetchall()
+                self._tables_cache = [row[0].strip() for row in rows]
+                logger.info("Retrieved tables: %s", self._tables_cache)
+            return list(self._tables_cache)
         return []
 
     def get_table_info(self, table_name):
+        """Return the cached columns/foreign_keys PRAGMA rows plus column_names, pk_col and pk_idx (-1 without a PK)."""
+        self._check_schema_version()
         if table_name not in self.metadata_cache:
-            self.cursor.execute(f'PRAGMA table_info("{table_name}")')
-            columns = self.cursor.fetchall()
-            self.cursor.execute(f'PRAGMA foreign_key_list("{table_name}")')
-            fks = self.cursor.fetchall()
-            self.metadata_cache[table_name] = {"columns": columns, "foreign_keys": fks}
-            logging.debug(f"Table info for {table_name}: columns={columns}, foreign_keys={fks}")
+            # Table-valued PRAGMA forms keep the SQL text constant, so every table reuses one cached statement
+            cursor = self.read_conn.cursor()
+            cursor.execute('SELECT cid, name, type, "notnull", dflt_value, pk FROM pragma_table_info(?)', (table_name,))
+            columns = cursor.fetchall()
+            cursor.execute("SELECT * FROM pragma_foreign_key_list(?)", (table_name,))
+            fks = cursor.fetchall()
+            column_names = [col[1] for col in columns]
+            pk_idx = next((i for i, col in enumerate(columns) if col[5]), -1)
+            self.metadata_cache[table_name] = {"columns": columns, "foreign_keys": fks, "column_names": column_names,
+                                               "pk_col": column_names[pk_idx] if pk_idx >= 0 else None,
+                                               "pk_idx": pk_idx,
+                                               # A lone INTEGER PRIMARY KEY aliases the rowid, so SQLite numbers it itself
+                                               "rowid_pk": pk_idx >= 0 and columns[pk_idx][2].upper() == "INTEGER"
+                                                           and sum(1 for col in columns if col[5]) == 1}
+            logger.debug("Table info for %s: columns=%s, foreign_keys=%s", table_name, columns, fks)
         return self.metadata_cache[table_name]
 
-    def backup_table(self, old_name, new_name):
-        self.cursor.execute(f'CREATE TABLE "{new_name}" AS SELECT * FROM "{old_name}"')
-        logging.info(f"Backed up {old_name} to {new_name}")
+    def get_table_sql(self, table_name):
+        row = self.read_conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
+                                     (table_name,)).fetchone()
+        return row[0] if row else ""
+
+    def get_dependent_sql(self, table_name, columns):
+        """Return (CREATE statements of the table's own indexes and triggers, names of indexes left out).
+
+        Indexes on a column not in `columns` are left out, so the caller can tell the user; PK/UNIQUE autoindexes
+        have no SQL and come back with the new CREATE TABLE.
+        """
+        rows = self.read_conn.execute("SELECT type, name, sql FROM sqlite_master WHERE tbl_name = ? "
+                                      "AND type IN ('index', 'trigger') AND sql IS NOT NULL ORDER BY type, name",
+                                      (table_name,)).fetchall()
+        statements, dropped = [], []
+        for obj_type, name, sql in rows:
+            if obj_type == "index":
+                # Expression parts have no name (and are kept); named key columns must survive the rebuild
+                missing = [col for (col,) in self.read_conn.execute(
+                    "SELECT name FROM pragma_index_xinfo(?) WHERE key AND name IS NOT NULL", (name,))
+                    if col not in columns]
+                if missing:
+                    logger.warning("Dropping index %s: column(s) %s no longer exist", name, missing)
+                    dropped.append(name)
+                    continue
+            statements.append(sql)
+        return statements, dropped
+
+    def get_single_pk_tables(self, base_type):
+        """Return the tables whose primary key is a single column of `base_type` (the FK candidates)."""
+        return [table for table, (_, pk_type) in self._get_single_pk_index().items()
+                if parse_type(pk_type)[0] == base_type]
+
+    def get_single_pk(self, table_name):
+        """Return (pk_name, pk_type) when `table_name` has a single-column primary key, else None."""
+        return self._get_single_pk_index().get(table_name)
+
+    def _get_single_pk_index(self):
+        self._check_schema_version()
+        if self._single_pk_index is None:
+            self._single_pk_index = self._load_single_pk_index(self.read_conn)
+        return self._single_pk_index
+
+    def prefetch_single_pk_index(self):
+        """Build the single-PK index on the thread pool so the FK checks find it cached."""
+        if self.is_connected() and self._single_pk_index is None and not self._pk_index_loading:
+            self._pk_index_loading = True
+            QThreadPool.globalInstance().start(MetadataWorker(self.db_path, self.metadata_signals))
+
+    def single_pk_index_pending(self):
+        """True while a background load is running and nothing is cached; metadata_signals.ready follows."""
+        return self._pk_index_loading and self._single_pk_index is None
+
+    def _store_single_pk_index(self, db_path, version, index):
+        if db_path == self.db_path and self.is_connected():
+            self._check_schema_version()  # Still flagged as loading, so this cannot start a second scan
+            if version == self._schema_version and self._single_pk_index is None:
+                self._single_pk_index = index
+        self._pk_index_loading = False
+        if version >= 0 and self._single_pk_index is None:
+            self.prefetch_single_pk_index()  # A DDL landed while the worker ran; scan the new schema
+            return
+        self.metadata_signals.ready.emit()
+
+    @staticmethod
+    def _load_single_pk_index(conn):
+        # One scan over sqlite_master instead of a table_info PRAGMA per table
+        rows = conn.execute("SELECT m.name, p.name, p.type FROM sqlite_master AS m "
+                            "JOIN pragma_table_info(m.name) AS p WHERE m.type = 'table' AND p.pk > 0").fetchall()
+        pk_columns = {}
+        for table, pk_name, pk_type in rows:
+            pk_columns.setdefault(table.strip(), []).append((pk_name, pk_type))
+        index = {table: pks[0] for table, pks in pk_columns.items() if len(pks) == 1}
+        logger.debug("Single-PK index: %s", index)
+        return index
+
+    def analyze(self, table_name):
+        """Refresh the planner statistics of one table, e.g. after a rebuild dropped its sqlite_stat1 rows."""
+        try:
+            with self.transaction() as cursor:
+                cursor.execute(f"ANALYZE {quote_ident(table_name)}")
+        except sqlite3.Error as e:
+            logger.warning("ANALYZE of %s failed: %s", table_name, e)
+
+    def invalidate_metadata(self):
+        """Drop cached schema information; call after any DDL."""
+        self.metadata_cache.clear()
+        self._tables_cache = None
+        self._single_pk_index = None
+        self._schema_version = None
+        self.prefetch_single_pk_index()
+
+    def backup_database(self, dest_path, progress=None):
+        """Copy the whole database to `dest_path` page by page (SQLite online backup), calling `progress(done, total)`."""
+        if os.path.abspath(dest_path) == os.path.abspath(self.db_path):
+            raise ValueError("The backup file must differ from the open database.")
+        with self._write_lock:
+            dest = sqlite3.connect(dest_path)
+            try:
+                # Copies pages at the pager level, without decoding rows; 1024 pages per step keeps progress moving
+                self.conn.backup(dest, pages=1024,
+                                 progress=(lambda status, remaining, total: progress(total - remaining, total))
+                                 if progress else None)
+            finally:
+                dest.close()
+        logger.info("Backed up database to %s", dest_path)
+
+    @contextmanager
+    def transaction(self):
+        """Group the enclosed statements into one BEGIN/COMMIT; roll back if the block raises."""
+        with self._write_lock:
+            if self.conn.in_transaction:
+                # Nested use joins the outer transaction, which owns the commit
+                yield self.cursor
+                return
+            # IMMEDIATE takes the write lock up front, so a busy database fails here rather than mid-batch
+            self.cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.cursor
+            except Exception:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+
+    @contextmanager
+    def foreign_keys_disabled(self):
+        """Suspend FK enforcement for a table rebuild and restore the previous setting afterwards."""
+        # The pragma is a no-op inside a transaction, so it is switched before the rebuild's BEGIN
+        enabled = self.conn.execute("PRAGMA foreign_keys").fetchone()[0]
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            yield
+        finally:
+            if self.conn.in_transaction:
+                self.conn.rollback()  # Nothing may stay open across the pragma switch back
+            self.conn.execute(f"PRAGMA foreign_keys={'ON' if enabled else 'OFF'}")
+
+    def change_stamp(self):
+        """Token that differs whenever table data may have changed, through this connection or another one."""
+        # total_changes: our own row writes; schema_version: our DDL; data_version: commits by other connections
+        return (self.conn.total_changes,
+                self.conn.execute("PRAGMA schema_version").fetchone()[0],
+                self.conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def foreign_key_violations(self):
+        """Return the rows PRAGMA foreign_key_check reports (table, rowid, parent, fkid); sees uncommitted writes."""
+        return self.conn.execute("PRAGMA foreign_key_check").fetchall()
 
     def execute_query(self, query, params=(), retries=3, delay=1):
+        """Run one statement and commit; returns its rows (e.g. from RETURNING) as a list."""
         for attempt in range(retries):
             try:
+                if _WRITE_RE.match(query) and not self.conn.in_transaction:
+                    # Taking the lock up front lets busy_timeout wait for it, instead of a deferred
+                    # transaction failing when it upgrades to a writer mid-statement
+                    with self.transaction() as cursor:
+                        cursor.execute(query, params)
+                        return cursor.fetchall()
                 self.cursor.execute(query, params)
+                rows = self.cursor.fetchall()
                 self.conn.commit()
-                return
+                return rows
             except sqlite3.OperationalError as e:
                 if "database is locked" in str(e).lower():
                     if attempt < retries - 1:
@@ -172,6 +544,38 @@ class DatabaseManager:
                     raise RuntimeError("The database is busy, please retry in a moment.") from e
                 raise
 
+# ----------------------
+# MetadataWorker (schema scans on the thread pool)
+# ----------------------
+class MetadataSignals(QObject):
+    """Lives on the GUI thread, so the worker's result is delivered there."""
+    loaded = pyqtSignal(str, int, object)  # db_path, schema_version the scan saw, single-PK index
+    ready = pyqtSignal()  # DatabaseManager has taken (or discarded) a loaded index
+
+
+class MetadataWorker(QRunnable):
+    """Builds DatabaseManager's single-PK index on its own read-only connection."""
+
+    def __init__(self, db_path, signals):
+        super().__init__()
+        self.db_path = db_path
+        self.signals = signals
+
+    def run(self):
+        index, version = {}, -1
+        try:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, cached_statements=256)
+            try:
+                conn.execute("PRAGMA busy_timeout=8000")
+                conn.execute("BEGIN")  # Version and scan from the same snapshot
+                version = conn.execute("PRAGMA schema_version").fetchone()[0]
+                index = DatabaseManager._load_single_pk_index(conn)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Background metadata scan failed: %s", e)
+        self.signals.loaded.emit(self.db_path, version, index)
+
 # ----------------------
 # SchemaEditor
 # ----------------------
@@ -183,7 +587,15 @@ class SchemaEditor(QWidget):
         super().__init__()
         self.db_manager = db_manager
         self.selected_field = None
-        self.original_fields = []
+        self._fields_dirty = False  # Field list edited since the table was loaded or applied
+        self._schema_dirty = False
+        self._schema_sql = ""  # Text currently in schema_box
+        # Coalesce bursts of field name/type edits into one FK probe
+        self._fk_debounce = QTimer(self)
+        self._fk_debounce.setSingleShot(True)
+        self._fk_debounce.setInterval(150)
+        self._fk_debounce.timeout.connect(self.update_fk_check_state)
+        self.db_manager.metadata_signals.ready.connect(self._fk_debounce.start)
         self.init_ui()
 
     def init_ui(self):
@@ -203,14 +615,14 @@ class SchemaEditor(QWidget):
         self.field_name = QLineEdit()
         self.field_name.setPlaceholderText("Field Name (e.g., Staff ID)")
         self.field_name.setMaximumWidth(400)
-        self.field_name.textChanged.connect(self.update_fk_check_state)
+        self.field_name.textChanged.connect(lambda _: self._fk_debounce.start())
         input_row1.addWidget(self.field_name)
         self.field_type = QComboBox()
         self.field_type.addItems(["INTEGER", "TEXT", "REAL", "BLOB", "NUMERIC", "DATE", "BOOLEAN", "CHAR", "VARCHAR"])
         self.field_type.setMinimumWidth(75)
         self.field_type.setCurrentText("INTEGER")
         self.field_type.currentTextChanged.connect(self.toggle_length_input)
-        self.field_type.currentTextChanged.connect(self.update_fk_check_state)
+        self.field_type.currentTextChanged.connect(lambda _: self._fk_debounce.start())
         input_row1.addWidget(self.field_type)
         self.length_input = QLineEdit()
         self.length_input.setPlaceholderText("Length (e.g., 50)")
@@ -251,13 +663,13 @@ class SchemaEditor(QWidget):
         self.fk_on_delete = QComboBox()
         self.fk_on_delete.addItems(["NO ACTION", "CASCADE", "SET NULL", "RESTRICT"])
         self.fk_on_delete.setEnabled(False)
-        self.fk_on_delete.currentTextChanged.connect(self.update_schema)
+        self.fk_on_delete.currentTextChanged.connect(lambda _: self._schedule_schema_update())
         input_row4.addWidget(QLabel("ON DELETE:"))
         input_row4.addWidget(self.fk_on_delete)
         self.fk_on_update = QComboBox()
         self.fk_on_update.addItems(["NO ACTION", "CASCADE", "SET NULL", "RESTRICT"])
         self.fk_on_update.setEnabled(False)
-        self.fk_on_update.currentTextChanged.connect(self.update_schema)
+        self.fk_on_update.currentTextChanged.connect(lambda _: self._schedule_schema_update())
         input_row4.addWidget(QLabel("ON UPDATE:"))
         input_row4.addWidget(self.fk_on_update)
         field_layout.addLayout(input_row4)
@@ -306,6 +718,8 @@ class SchemaEditor(QWidget):
         layout.addWidget(apply_btn)
 
         self.fields = []
+        self._fields_by_name = {}  # name -> the same dicts as in self.fields, for O(1) lookups
+        self._auto_number_field = None  # Name of the one AutoNumber field, if any
         self.refresh_tables()
 
     def refresh_tables(self):
@@ -314,26 +728,27 @@ class SchemaEditor(QWidget):
         if self.db_manager.is_connected():
             self.table_combo.addItems(self.db_manager.get_tables())
         self.clear_fields(preserve_fields=False)
-        self.original_fields = self.fields.copy()
 
     def new_table(self):
         table_name, ok = QInputDialog.getText(self, "New Table", "Enter table name:")
         if ok and table_name:
-            if table_name.strip() in self.db_manager.get_tables():
+            table_name = table_name.strip()
+            if table_name in self.db_manager.get_tables():
                 QMessageBox.critical(self, "Error", "Table already exists")
                 return
-            if not table_name.strip() or any(c in table_name for c in ";\"'"):
+            if not table_name or not _FORBIDDEN_NAME_CHARS.isdisjoint(table_name):
                 QMessageBox.critical(self, "Error", "Invalid table name")
                 return
-            self.table_combo.addItem(table_name.strip())
-            self.table_combo.setCurrentText(table_name.strip())
+            self.table_combo.addItem(table_name)
+            self.table_combo.setCurrentText(table_name)
             self.clear_fields(preserve_fields=False)
-            self.original_fields = self.fields.copy()
 
     def clear_fields(self, preserve_fields=True):
         if not preserve_fields:
             self.field_tree.clear()
             self.fields = []
+            self._fields_dirty = False
+            self._index_fields()
         self.field_name.clear()
         self.field_type.setCurrentText("INTEGER")
         self.length_input.clear()
@@ -356,40 +771,33 @@ class SchemaEditor(QWidget):
         self.modify_field_btn.setEnabled(False)
         self.remove_field_btn.setEnabled(False)
         self.selected_field = None
-        logging.debug(
-            f"Cleared fields, UI state: modify_btn={self.modify_field_btn.isEnabled()}, remove_btn={self.remove_field_btn.isEnabled()}")
+        logger.debug(
+            "Cleared fields, UI state: modify_btn=%s, remove_btn=%s", self.modify_field_btn.isEnabled(), self.remove_field_btn.isEnabled())
 
     def toggle_length_input(self, type_name):
         is_char_type = type_name in ["CHAR", "VARCHAR"]
         self.length_input.setVisible(is_char_type)
-        logging.debug(f"Toggled length input for type {type_name}, visibility={is_char_type}")
-        self.update_schema()
+        logger.debug("Toggled length input for type %s, visibility=%s", type_name, is_char_type)
+        self._schedule_schema_update()
 
     def update_fk_check_state(self):
+        if self.db_manager.single_pk_index_pending():
+            return  # Re-run through metadata_signals.ready once the background scan is in
         current_table = self.table_combo.currentText().strip()
         field_name = self.field_name.text().strip()
         field_type = self.get_current_field_type()
         can_be_fk = False
 
         if field_name and field_type and current_table != "Select Table":
-            tables = [t for t in self.db_manager.get_tables() if t != current_table]
-            logging.debug(
-                f"update_fk_check_state: Checking field_name={field_name}, field_type={field_type}, current_table={current_table}, tables={tables}")
-            for table in tables:
-                info = self.db_manager.get_table_info(table)
-                pk_fields = [col for col in info["columns"] if col[5]]  # col[5] is pk
-                if len(pk_fields) == 1:
-                    pk_id, pk_name, pk_type, _, _, _ = pk_fields[0]
-                    pk_base_type = pk_type.split("(")[0] if "(" in pk_type else pk_type
-                    field_base_type = field_type.split("(")[0] if "(" in field_type else field_type
-                    logging.debug(
-                        f"Comparing: pk_name={pk_name}, pk_type={pk_type}, pk_base_type={pk_base_type}, field_name={field_name}, field_type={field_type}, field_base_type={field_base_type}")
-                    if pk_base_type == field_base_type:  # Only type compatibility required
-                        can_be_fk = True
-                        break
+            field_base_type = parse_type(field_type)[0]
+            # Only type compatibility with a single-column PK is required
+            tables = [t for t in self.db_manager.get_single_pk_tables(field_base_type) if t != current_table]
+            logger.debug(
+                "update_fk_check_state: Checking field_name=%s, field_type=%s, current_table=%s, candidates=%s", field_name, field_type, current_table, tables)
+            can_be_fk = bool(tables)
 
         self.foreign_key.setEnabled(can_be_fk)
-        logging.debug(f"update_fk_check_state: FK enabled={can_be_fk}")
+        logger.debug("update_fk_check_state: FK enabled=%s", can_be_fk)
 
     def get_current_field_type(self):
         type_name = self.field_type.currentText()
@@ -413,62 +821,46 @@ class SchemaEditor(QWidget):
             self.fk_on_update.setCurrentText("RESTRICT")
         if self.selected_field:
             self.update_field_properties()
-        self.update_schema()
-        logging.debug(f"update_fk_widgets: enabled={enabled}")
+        self._schedule_schema_update()
+        logger.debug("update_fk_widgets: enabled=%s", enabled)
 
     def update_fk_ref_table_combo(self):
-        self.fk_table.blockSignals(True)
-        self.fk_table.clear()
-        self.fk_table.addItem("Select Table")
-        field_name = self.field_name.text().strip()
-        field_type = self.get_current_field_type()
-        current_table = self.table_combo.currentText().strip()
-
-        if field_name and field_type and current_table != "Select Table":
-            tables = [t for t in self.db_manager.get_tables() if t != current_table]
-            for table in tables:
-                info = self.db_manager.get_table_info(table)
-                pk_fields = [col for col in info["columns"] if col[5]]  # col[5] is pk
-                if len(pk_fields) == 1:
-                    pk_id, pk_name, pk_type, _, _, _ = pk_fields[0]
-                    pk_base_type = pk_type.split("(")[0] if "(" in pk_type else pk_type
-                    field_base_type = field_type.split("(")[0] if "(" in field_type else field_type
-                    if pk_base_type == field_base_type:
-                        self.fk_table.addItem(table)
-        self.fk_table.blockSignals(False)
+        with QSignalBlocker(self.fk_table):
+            self.fk_table.clear()
+            self.fk_table.addItem("Select Table")
+            field_name = self.field_name.text().strip()
+            field_type = self.get_current_field_type()
+            current_table = self.table_combo.currentText().strip()
+
+            if field_name and field_type and current_table != "Select Table":
+                field_base_type = parse_type(field_type)[0]
+                self.fk_table.addItems([t for t in self.db_manager.get_single_pk_tables(field_base_type) if t != current_table])
         self.update_fk_column_combo()
-        logging.debug(f"update_fk_ref_table_combo: tables added={self.fk_table.count() - 1}")
+        logger.debug("update_fk_ref_table_combo: tables added=%s", self.fk_table.count() - 1)
 
     def update_fk_column_combo(self):
-        self.fk_column.blockSignals(True)
-        self.fk_column.clear()
-        ref_table = self.fk_table.currentText()
-        if ref_table and ref_table != "Select Table":
-            info = self.db_manager.get_table_info(ref_table)
-            pk_fields = [col for col in info["columns"] if col[5]]  # col[5] is pk
-            if len(pk_fields) == 1:
-                _, pk_name, _, _, _, _ = pk_fields[0]
-                self.fk_column.addItem(pk_name)
-        self.fk_column.blockSignals(False)
-        logging.debug(f"update_fk_column_combo: columns added={self.fk_column.count()}")
+        with QSignalBlocker(self.fk_column):
+            self.fk_column.clear()
+            ref_table = self.fk_table.currentText()
+            if ref_table and ref_table != "Select Table":
+                pk = self.db_manager.get_single_pk(ref_table)
+                if pk:
+                    self.fk_column.addItem(pk[0])
+        logger.debug("update_fk_column_combo: columns added=%s", self.fk_column.count())
 
     def update_auto_number(self):
         if self.auto_number.isChecked() and not self.primary_key.isChecked():
             self.primary_key.setChecked(True)
         if self.selected_field:
             self.update_field_properties()
-        logging.debug(f"Updated auto number, state={self.auto_number.isChecked()}")
-        self.update_schema()
+        logger.debug("Updated auto number, state=%s", self.auto_number.isChecked())
+        self._schedule_schema_update()
 
     def get_table_sql(self, table_name):
         try:
-            self.db_manager.cursor.execute(
-                f"SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table_name,)
-            )
-            result = self.db_manager.cursor.fetchone()
-            return result[0] if result else ""
+            return self.db_manager.get_table_sql(table_name)
         except sqlite3.Error as e:
-            logging.error(f"Failed to get table SQL for {table_name}: {str(e)}")
+            logger.error("Failed to get table SQL for %s: %s", table_name, e)
             return ""
 
     def load_table(self, table_name):
@@ -477,24 +869,33 @@ class SchemaEditor(QWidget):
             return
         try:
             info = self.db_manager.get_table_info(table_name)
-            create_sql = self.get_table_sql(table_name).upper()
+            if "col_flags" not in info:
+                # Parsed once per table and dropped together with the rest of the metadata cache
+                info["col_flags"] = parse_column_flags(self.get_table_sql(table_name))
+            col_flags = info["col_flags"]
+            items = []
             for col in info["columns"]:
                 cid, name, col_type, not_null, default, pk = col
-                is_auto = col_type == "INTEGER" and pk and "AUTOINCREMENT" in create_sql
-                is_unique = f'"{name}"' in create_sql and "UNIQUE" in create_sql and not pk
+                autoincrement, unique = col_flags.get(name, (False, False))
+                is_auto = col_type == "INTEGER" and bool(pk) and autoincrement
+                is_unique = unique and not pk
                 fk_info = next((fk for fk in info.get("foreign_keys", []) if fk[3] == name), None)
                 fk_display = f"{fk_info[2]}({fk_info[4]})" if fk_info else ""
-                item = QTreeWidgetItem([
-                    name, col_type,
-                    col_type[col_type.find("(") + 1:col_type.find(")")] if "(" in col_type else "",
-                    "✓" if not_null else "",
-                    "✓" if pk else "",
-                    "✓" if is_auto else "",
-                    "✓" if is_unique else "",
-                    str(default) if default else "",
-                    "", fk_display
-                ])
-                self.field_tree.addTopLevelItem(item)
+                # Columns left unset are already empty, so only non-empty cells get a setText call
+                item = QTreeWidgetItem()
+                item.setText(0, name)
+                item.setText(1, col_type)
+                length = parse_type(col_type)[1]
+                if length:
+                    item.setText(2, length)
+                for column, flag in ((3, not_null), (4, pk), (5, is_auto), (6, is_unique)):
+                    if flag:
+                        item.setText(column, _CHECK)
+                if default:
+                    item.setText(7, str(default))
+                if fk_display:
+                    item.setText(9, fk_display)
+                items.append(item)
                 self.fields.append({
                     "name": name, "type": col_type, "not_null": bool(not_null), "primary_key": bool(pk),
                     "auto_number": is_auto, "unique": is_unique, "default": default, "check": "",
@@ -502,57 +903,76 @@ class SchemaEditor(QWidget):
                                     "on_delete": fk_info[5] if fk_info else "RESTRICT",
                                     "on_update": fk_info[6] if fk_info else "RESTRICT"}
                 })
-            self.original_fields = self.fields.copy()
-            logging.debug(f"Loaded table {table_name}, fields={self.fields}")
-            self.update_schema()
+            # One insertion with repaints and signals held back, instead of a layout pass per column
+            self.field_tree.setUpdatesEnabled(False)
+            self.field_tree.blockSignals(True)
+            try:
+                self.field_tree.addTopLevelItems(items)
+            finally:
+                self.field_tree.blockSignals(False)
+                self.field_tree.setUpdatesEnabled(True)
+            self._index_fields()
+            logger.debug("Loaded table %s, fields=%s", table_name, self.fields)
+            self._schedule_schema_update()
             self.update_fk_check_state()
         except Exception as e:
-            logging.error(f"Failed to load table {table_name}: {str(e)}")
+            logger.error("Failed to load table %s: %s", table_name, e)
             QMessageBox.critical(self, "Error", f"Failed to load table: {str(e)}")
 
+    def _index_fields(self):
+        """Rebuild the name index after self.fields was replaced wholesale."""
+        self._fields_by_name = {f["name"]: f for f in self.fields}
+        self._auto_number_field = next((f["name"] for f in self.fields if f["auto_number"]), None)
+
     def select_field(self, item, column):
         self.selected_field = item
         self.update_field_properties()
         self.modify_field_btn.setEnabled(True)
         self.remove_field_btn.setEnabled(True)
-        logging.debug(f"Selected field: {item.text(0)}")
+        logger.debug("Selected field: %s", item.text(0))
 
     def update_field_properties(self):
         if not self.selected_field:
             self.modify_field_btn.setEnabled(False)
             self.remove_field_btn.setEnabled(False)
             return
-        field_data = next((f for f in self.fields if f["name"] == self.selected_field.text(0)), None)
+        field_data = self._fields_by_name.get(self.selected_field.text(0))
         if not field_data:
             self.modify_field_btn.setEnabled(False)
             self.remove_field_btn.setEnabled(False)
             return
-        self.field_name.setText(field_data["name"])
-        type_text = field_data["type"]
-        if "(" in type_text:
-            base_type, length = type_text.split("(")
-            length = length.rstrip(")")
+        fk = field_data["foreign_key"]
+        # Filling the form is not an edit: hold back the per-widget signals (and the schema/FK
+        # refreshes they cascade into) and run the few needed updates once afterwards
+        with ExitStack() as stack:
+            for widget in (self.field_name, self.field_type, self.length_input, self.not_null, self.primary_key,
+                           self.auto_number, self.unique, self.foreign_key, self.default_value, self.check_constraint,
+                           self.fk_table, self.fk_column, self.fk_on_delete, self.fk_on_update):
+                stack.enter_context(QSignalBlocker(widget))
+            self.field_name.setText(field_data["name"])
+            base_type, length = parse_type(field_data["type"])
             self.field_type.setCurrentText(base_type)
             self.length_input.setText(length)
-        else:
-            self.field_type.setCurrentText(type_text)
-            self.length_input.clear()
-        self.toggle_length_input(self.field_type.currentText())
-        self.not_null.setChecked(field_data["not_null"])
-        self.primary_key.setChecked(field_data["primary_key"])
-        self.auto_number.setChecked(field_data["auto_number"])
-        self.unique.setChecked(field_data["unique"])
-        self.foreign_key.setChecked(bool(field_data["foreign_key"]["table"]))
-        self.default_value.setText(str(field_data["default"]) if field_data["default"] else "")
-        self.check_constraint.setText(field_data["check"])
-        self.fk_table.setCurrentText(field_data["foreign_key"]["table"] or "Select Table")
-        self.fk_column.setCurrentText(field_data["foreign_key"]["column"] or "")
-        self.fk_on_delete.setCurrentText(field_data["foreign_key"]["on_delete"])
-        self.fk_on_update.setCurrentText(field_data["foreign_key"]["on_update"])
-        self.fk_table.setEnabled(bool(field_data["foreign_key"]["table"]))
-        self.fk_column.setEnabled(bool(field_data["foreign_key"]["table"]))
-        self.fk_on_delete.setEnabled(bool(field_data["foreign_key"]["table"]))
-        self.fk_on_update.setEnabled(bool(field_data["foreign_key"]["table"]))
+            self.toggle_length_input(base_type)
+            self.not_null.setChecked(field_data["not_null"])
+            self.primary_key.setChecked(field_data["primary_key"])
+            self.auto_number.setChecked(field_data["auto_number"])
+            self.unique.setChecked(field_data["unique"])
+            self.foreign_key.setChecked(bool(fk["table"]))
+            self.default_value.setText(str(field_data["default"]) if field_data["default"] else "")
+            self.check_constraint.setText(field_data["check"])
+            if fk["table"]:
+                self.update_fk_ref_table_combo()
+                self.fk_table.setCurrentText(fk["table"])
+                self.update_fk_column_combo()
+                self.fk_column.setCurrentText(fk["column"] or "")
+            else:
+                self.fk_table.setCurrentIndex(0)
+                self.fk_column.clear()
+            self.fk_on_delete.setCurrentText(fk["on_delete"])
+            self.fk_on_update.setCurrentText(fk["on_update"])
+        for widget in (self.fk_table, self.fk_column, self.fk_on_delete, self.fk_on_update):
+            widget.setEnabled(bool(fk["table"]))
         self.update_fk_check_state()
 
     def add_field(self):
@@ -560,13 +980,13 @@ class SchemaEditor(QWidget):
         if not name:
             QMessageBox.critical(self, "Error", "Field name cannot be empty")
             return
-        if name in [f["name"] for f in self.fields]:
+        if name in self._fields_by_name:
             QMessageBox.critical(self, "Error", "Field name already exists in this table")
             return
         if self.field_type.currentIndex() == -1:
             QMessageBox.warning(self, "Warning", "Please assign a datatype to the field")
             return
-        if self.auto_number.isChecked() and any(f["auto_number"] for f in self.fields):
+        if self.auto_number.isChecked() and self._auto_number_field is not None:
             QMessageBox.critical(self, "Error", "Only one AutoNumber field is allowed per table")
             return
         type_name = self.get_current_field_type()
@@ -585,18 +1005,22 @@ class SchemaEditor(QWidget):
             QMessageBox.critical(self, "Error", "AutoNumber requires INTEGER type")
             return
         self.fields.append(field)
+        self._fields_by_name[name] = field
+        if field["auto_number"]:
+            self._auto_number_field = name
         fk_display = f"{self.fk_table.currentText()}({self.fk_column.currentText()}) ON DELETE {self.fk_on_delete.currentText()} ON UPDATE {self.fk_on_update.currentText()}" if self.foreign_key.isChecked() else ""
+        base_type, length = parse_type(field["type"])
         item = QTreeWidgetItem([
-            name, field["type"].split("(")[0] if "(" in field["type"] else field["type"],
-            field["type"][field["type"].find("(") + 1:field["type"].find(")")] if "(" in field["type"] else "",
-            "✓" if field["not_null"] else "", "✓" if field["primary_key"] else "",
-            "✓" if field["auto_number"] else "", "✓" if field["unique"] else "",
+            name, base_type, length,
+            _CHECK if field["not_null"] else "", _CHECK if field["primary_key"] else "",
+            _CHECK if field["auto_number"] else "", _CHECK if field["unique"] else "",
             field["default"], field["check"], fk_display
         ])
         self.field_tree.addTopLevelItem(item)
+        self._fields_dirty = True
         self.clear_fields(preserve_fields=True)
-        self.update_schema()
-        logging.debug(f"Added field: {field}")
+        self._schedule_schema_update()
+        logger.debug("Added field: %s", field)
 
     def modify_field(self):
         if not self.selected_field:
@@ -607,19 +1031,19 @@ class SchemaEditor(QWidget):
             if not new_name:
                 QMessageBox.critical(self, "Error", "Field name cannot be empty")
                 return
-            if new_name in [f["name"] for f in self.fields if f["name"] != old_name]:
+            if new_name != old_name and new_name in self._fields_by_name:
                 QMessageBox.critical(self, "Error", "Field name already exists in this table")
                 return
             if self.field_type.currentIndex() == -1:
                 QMessageBox.warning(self, "Warning", "Please assign a datatype to the field")
                 return
-            if self.auto_number.isChecked() and any(f["auto_number"] for f in self.fields if f["name"] != old_name):
+            if self.auto_number.isChecked() and self._auto_number_field not in (None, old_name):
                 QMessageBox.critical(self, "Error", "Only one AutoNumber field is allowed per table")
                 return
             new_type = self.get_current_field_type()
-            field_index = next(i for i, f in enumerate(self.fields) if f["name"] == old_name)
-            old_data = self.fields[field_index].copy()
-            self.fields[field_index].update({
+            field = self._fields_by_name.pop(old_name)
+            old_data = field.copy()
+            field.update({
                 "name": new_name,
                 "type": new_type,
                 "not_null": self.not_null.isChecked(),
@@ -634,25 +1058,31 @@ class SchemaEditor(QWidget):
                     "on_delete": self.fk_on_delete.currentText(),
                     "on_update": self.fk_on_update.currentText()}
             })
+            self._fields_by_name[new_name] = field
+            if field["auto_number"]:
+                self._auto_number_field = new_name
+            elif self._auto_number_field == old_name:
+                self._auto_number_field = None
             self.selected_field.setText(0, new_name)
-            self.selected_field.setText(1, new_type.split("(")[0] if "(" in new_type else new_type)
-            self.selected_field.setText(2,
-                                        new_type[new_type.find("(") + 1:new_type.find(")")] if "(" in new_type else "")
-            self.selected_field.setText(3, "✓" if self.not_null.isChecked() else "")
-            self.selected_field.setText(4, "✓" if self.primary_key.isChecked() else "")
-            self.selected_field.setText(5, "✓" if self.auto_number.isChecked() else "")
-            self.selected_field.setText(6, "✓" if self.unique.isChecked() else "")
+            base_type, length = parse_type(new_type)
+            self.selected_field.setText(1, base_type)
+            self.selected_field.setText(2, length)
+            self.selected_field.setText(3, _CHECK if self.not_null.isChecked() else "")
+            self.selected_field.setText(4, _CHECK if self.primary_key.isChecked() else "")
+            self.selected_field.setText(5, _CHECK if self.auto_number.isChecked() else "")
+            self.selected_field.setText(6, _CHECK if self.unique.isChecked() else "")
             self.selected_field.setText(7,
                                         self.default_value.text().strip() if self.default_value.text().strip() else "")
             self.selected_field.setText(8,
                                         self.check_constraint.text().strip() if self.check_constraint.text().strip() else "")
             fk_display = f"{self.fk_table.currentText()}({self.fk_column.currentText()}) ON DELETE {self.fk_on_delete.currentText()} ON UPDATE {self.fk_on_update.currentText()}" if self.foreign_key.isChecked() else ""
             self.selected_field.setText(9, fk_display)
-            self.update_schema()
+            self._fields_dirty = True
+            self._schedule_schema_update()
             self.clear_fields(preserve_fields=True)
-            logging.debug(f"Modified field: {new_name}, old data={old_data}, new data={self.fields[field_index]}")
+            logger.debug("Modified field: %s, old data=%s, new data=%s", new_name, old_data, field)
         except Exception as e:
-            logging.error(f"Error in modify_field: {str(e)}")
+            logger.error("Error in modify_field: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to modify field: {str(e)}")
 
     def remove_field(self):
@@ -660,50 +1090,118 @@ class SchemaEditor(QWidget):
             return
         name = self.selected_field.text(0)
         self.fields = [f for f in self.fields if f["name"] != name]
+        self._fields_by_name.pop(name, None)
+        if self._auto_number_field == name:
+            self._auto_number_field = None
         self.field_tree.takeTopLevelItem(self.field_tree.indexOfTopLevelItem(self.selected_field))
+        self._fields_dirty = True
         self.clear_fields(preserve_fields=True)
-        self.update_schema()
-        logging.debug(f"Removed field: {name}")
+        self._schedule_schema_update()
+        logger.debug("Removed field: %s", name)
+
+    def _schedule_schema_update(self):
+        """Mark the CREATE TABLE preview stale; it is rebuilt once when control returns to the event loop."""
+        if not self._schema_dirty:
+            self._schema_dirty = True
+            QTimer.singleShot(0, self._flush_schema)
+
+    def _flush_schema(self):
+        if self._schema_dirty:
+            self._schema_dirty = False
+            self.update_schema()
 
     def update_schema(self):
+        self._schema_dirty = False
         table_name = self.table_combo.currentText()
         if table_name == "Select Table" or not self.fields:
             self.schema_box.clear()
+            self._schema_sql = ""
             return
         columns = []
         pk_fields = []
         fk_constraints = []
+        autoinc_parts = None  # Fragments of the AutoNumber column, if any
         for field in self.fields:
-            col_def = f'\t"{field["name"]}"\t{field["type"]}'
+            # Fragments are collected and joined once instead of growing the string with +=
+            parts = ['\t', quote_ident(field["name"]), '\t', field["type"]]
             if field["not_null"]:
-                col_def += " NOT NULL"
+                parts.append(" NOT NULL")
             if field["unique"] and not field["primary_key"]:
-                col_def += " UNIQUE"
+                parts.append(" UNIQUE")
             if field["default"]:
-                col_def += f" DEFAULT {field['default']}"
+                parts += [" DEFAULT ", str(field["default"])]
             if field["check"]:
-                col_def += f" CHECK ({field['check']})"
-            columns.append(col_def)
+                parts += [" CHECK (", field["check"], ")"]
+            columns.append(parts)
             if field["primary_key"]:
-                pk_fields.append(f'"{field["name"]}"')
-            if field["foreign_key"]["table"]:
-                fk_constraint = f'\tFOREIGN KEY("{field["name"]}") REFERENCES "{field["foreign_key"]["table"]}"("{field["foreign_key"]["column"]}")'
-                if field["foreign_key"]["on_delete"] != "RESTRICT":
-                    fk_constraint += f" ON DELETE {field['foreign_key']['on_delete']}"
-                if field["foreign_key"]["on_update"] != "RESTRICT":
-                    fk_constraint += f" ON UPDATE {field['foreign_key']['on_update']}"
-                fk_constraints.append(fk_constraint)
-        sql = f'CREATE TABLE "{table_name}" (\n'
-        sql += ",\n".join(columns)
-        if pk_fields:
-            sql += f",\n\tPRIMARY KEY({','.join(pk_fields)})"
-            if any(f["auto_number"] for f in self.fields if f["primary_key"]):
-                sql = sql.replace("PRIMARY KEY", "PRIMARY KEY AUTOINCREMENT")
-        if fk_constraints:
-            sql += ",\n" + ",\n".join(fk_constraints)
-        sql += '\n);'
-        self.schema_box.setText(sql)
-        logging.debug(f"Updated schema for {table_name}: {sql}")
+                pk_fields.append(quote_ident(field["name"]))
+                if field["auto_number"]:
+                    autoinc_parts = parts
+            fk = field["foreign_key"]
+            if fk["table"]:
+                parts = [f'\tFOREIGN KEY({quote_ident(field["name"])}) REFERENCES {quote_ident(fk["table"])}({quote_ident(fk["column"])})']
+                if fk["on_delete"] != "RESTRICT":
+                    parts += [" ON DELETE ", fk["on_delete"]]
+                if fk["on_update"] != "RESTRICT":
+                    parts += [" ON UPDATE ", fk["on_update"]]
+                fk_constraints.append("".join(parts))
+        inline_pk = autoinc_parts is not None and len(pk_fields) == 1
+        if inline_pk:
+            # SQLite only accepts AUTOINCREMENT as a column constraint, right on the single INTEGER PK
+            autoinc_parts.insert(4, " PRIMARY KEY AUTOINCREMENT")
+        columns = ["".join(parts) for parts in columns]
+        if pk_fields and not inline_pk:
+            columns.append(f"\tPRIMARY KEY({','.join(pk_fields)})")
+        sql = "".join([f'CREATE TABLE {quote_ident(table_name)} (\n', ",\n".join(columns + fk_constraints), '\n);'])
+        if sql == self._schema_sql:
+            return  # Unchanged (e.g. a field was only selected); skip the document re-layout
+        self._schema_sql = sql
+        self.schema_box.setPlainText(sql)  # Plain text: no rich-text sniffing of CHECK expressions like "a < b"
+        logger.debug("Updated schema for %s: %s", table_name, sql)
+
+    @staticmethod
+    def _field_matches_column(field, col):
+        """True when the field still has the type, NOT NULL, default and PK of a table_info row."""
+        return (field["type"] == col[2] and field["not_null"] == bool(col[3]) and
+                (field["default"] or None) == col[4] and field["primary_key"] == bool(col[5]))
+
+    def _native_alter_plan(self, existing_columns, new_fields, modified_fields, removed_fields):
+        """Return (renames, drops) when the edit is only column renames or only column drops, else None."""
+        if not _NATIVE_ALTER or modified_fields or not removed_fields:
+            return None
+        old_names = list(existing_columns)
+        names = [f["name"] for f in self.fields]
+        if not new_fields:
+            # Pure drops: the surviving columns must keep their order, otherwise only a rebuild can apply it
+            removed = set(removed_fields)
+            if [n for n in old_names if n not in removed] == names:
+                return [], removed_fields
+            return None
+        if len(new_fields) != len(removed_fields) or len(names) != len(old_names):
+            return None
+        # Pure renames: a removed column and a new field in the same position with the same definition
+        renames = []
+        for old_name, field in zip(old_names, self.fields):
+            if old_name == field["name"]:
+                continue
+            if field["name"] in existing_columns or not self._field_matches_column(field, existing_columns[old_name]):
+                return None
+            renames.append((old_name, field["name"]))
+        return renames, []
+
+    def _apply_native_alter(self, table_name, renames, drops):
+        """Apply renames/drops with ALTER TABLE in one transaction; False if SQLite refuses and a rebuild is needed."""
+        try:
+            with self.db_manager.transaction() as cursor:
+                for old_name, new_name in renames:
+                    cursor.execute(f'ALTER TABLE {quote_ident(table_name)} RENAME COLUMN {quote_ident(old_name)} TO {quote_ident(new_name)}')
+                for name in drops:
+                    cursor.execute(f'ALTER TABLE {quote_ident(table_name)} DROP COLUMN {quote_ident(name)}')
+        except sqlite3.OperationalError as e:
+            # e.g. dropping a PK, UNIQUE, indexed or FK column; the rebuild path handles those
+            logger.info("Native ALTER not possible for %s, rebuilding: %s", table_name, e)
+            return False
+        return True
 
     def apply_changes(self):
         table_name = self.table_combo.currentText()
@@ -715,81 +1213,96 @@ class SchemaEditor(QWidget):
                 QMessageBox.warning(self, "Warning",
                                     f"Field '{field['name']}' has no datatype assigned. Please assign a datatype before applying changes.")
                 return
+        self._flush_schema()  # The rebuild and CREATE paths read the preview text
         try:
-            logging.debug(f"Applying changes for table: {table_name}")
+            logger.debug("Applying changes for table: %s", table_name)
             existing_tables = self.db_manager.get_tables()
             if table_name in existing_tables:
                 existing_info = self.db_manager.get_table_info(table_name)
                 existing_columns = {col[1]: col for col in existing_info["columns"]}
+                current_names = {f["name"] for f in self.fields}
                 new_fields = [f for f in self.fields if f["name"] not in existing_columns]
-                modified_fields = []
-                for f in self.fields:
-                    if f["name"] in existing_columns:
-                        col = existing_columns[f["name"]]
-                        if (f["type"] != col[2] or
-                                f["not_null"] != bool(col[3]) or
-                                f["default"] != col[4] or
-                                f["primary_key"] != bool(col[5])):
-                            modified_fields.append(f)
-                removed_fields = [col for col in existing_columns if col not in [f["name"] for f in self.fields]]
-
-                if new_fields:
-                    for field in new_fields:
-                        col_def = f'"{field["name"]}" {field["type"]}'
-                        if field["not_null"] and not field["default"]:
-                            col_def += " NOT NULL"
-                        if field["default"]:
-                            col_def += f" DEFAULT {field['default']}"
-                        sql = f'ALTER TABLE "{table_name}" ADD COLUMN {col_def}'
-                        self.db_manager.cursor.execute(sql)
-
-                if modified_fields or removed_fields:
+                modified_fields = [f for f in self.fields if f["name"] in existing_columns
+                                   and not self._field_matches_column(f, existing_columns[f["name"]])]
+                removed_fields = [col for col in existing_columns if col not in current_names]
+
+                dropped_indexes = []
+                plan = self._native_alter_plan(existing_columns, new_fields, modified_fields, removed_fields)
+                if plan and self._apply_native_alter(table_name, *plan):
+                    pass  # Renamed/dropped in place, no rows copied
+                elif modified_fields or removed_fields:
+                    # SQLite cannot alter columns in place: rebuild under a temp name and swap, as one script
+                    # and one transaction. The rebuild also creates any new fields, so no ADD COLUMN is needed.
+                    # Order follows sqlite.org's ALTER TABLE procedure (create new, copy, drop old, rename new,
+                    # recreate indexes and triggers), so rows are copied exactly once; a kept backup would have
+                    # to be renamed, not copied. Indexes are built after the copy, in one sorted pass each,
+                    # rather than maintained row by row during it.
+                    dependents, dropped_indexes = self.db_manager.get_dependent_sql(table_name, current_names)
                     temp_name = f"{table_name}_temp"
-                    create_sql = self.schema_box.toPlainText().replace(f'"{table_name}"', f'"{temp_name}"')
-                    self.db_manager.cursor.executescript(create_sql)
-
-                    new_columns = [f'"{f["name"]}"' for f in self.fields]
-                    old_columns = [f'"{col}"' for col in existing_columns if col in [f["name"] for f in self.fields]]
-                    if not old_columns:
-                        insert_sql = f'INSERT INTO "{temp_name}" ({",".join(new_columns)}) VALUES ({",".join(["NULL" for _ in new_columns])})'
-                        self.db_manager.cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
-                        row_count = self.db_manager.cursor.fetchone()[0]
-                        for _ in range(row_count):
-                            self.db_manager.cursor.execute(insert_sql)
-                    else:
-                        insert_sql = f'INSERT INTO "{temp_name}" ({",".join(new_columns)}) SELECT {",".join(old_columns + ["NULL" for _ in range(len(new_columns) - len(old_columns))])} FROM "{table_name}"'
-                        self.db_manager.cursor.execute(insert_sql)
-
-                    self.db_manager.cursor.execute(f'DROP TABLE "{table_name}"')
-                    self.db_manager.cursor.execute(f'ALTER TABLE "{temp_name}" RENAME TO "{table_name}"')
+                    create_sql = self.schema_box.toPlainText().replace(quote_ident(table_name), quote_ident(temp_name))
+                    new_columns = [quote_ident(f["name"]) for f in self.fields]
+                    # Surviving columns are copied by name; fields that did not exist before start out NULL
+                    select_columns = [quote_ident(f["name"]) if f["name"] in existing_columns else "NULL" for f in self.fields]
+                    statements = [
+                        create_sql.rstrip().rstrip(";"),
+                        f'INSERT INTO {quote_ident(temp_name)} ({",".join(new_columns)}) SELECT {",".join(select_columns)} FROM {quote_ident(table_name)}',
+                        f'DROP TABLE {quote_ident(table_name)}',
+                        f'ALTER TABLE {quote_ident(temp_name)} RENAME TO {quote_ident(table_name)}',
+                        *dependents,
+                    ]
+                    with self.db_manager.foreign_keys_disabled(), self.db_manager.transaction() as cursor:
+                        for sql in statements:
+                            cursor.execute(sql)
+                        # References are checked once, before the single commit; raising rolls everything back
+                        violations = self.db_manager.foreign_key_violations()
+                        if violations:
+                            raise sqlite3.IntegrityError(
+                                f"{len(violations)} row(s) violate foreign keys after the rebuild, "
+                                f"first in table {violations[0][0]}")
+                elif new_fields:
+                    # All ADD COLUMNs commit together or not at all
+                    with self.db_manager.transaction() as cursor:
+                        for field in new_fields:
+                            col_def = f'{quote_ident(field["name"])} {field["type"]}'
+                            if field["not_null"] and not field["default"]:
+                                col_def += " NOT NULL"
+                            if field["default"]:
+                                col_def += f" DEFAULT {field['default']}"
+                            cursor.execute(f'ALTER TABLE {quote_ident(table_name)} ADD COLUMN {col_def}')
 
                 self.db_manager.conn.commit()
-                QMessageBox.information(self, "Success", "Changes applied")
+                self.db_manager.invalidate_metadata()
+                self.db_manager.analyze(table_name)  # A rebuilt table starts without planner statistics
+                if dropped_indexes:
+                    QMessageBox.warning(self, "Indexes Dropped",
+                                        "Changes applied, but these indexes used renamed or removed columns and "
+                                        f"were not recreated: {', '.join(dropped_indexes)}")
+                else:
+                    QMessageBox.information(self, "Success", "Changes applied")
                 self.table_changed.emit()  # Notify other tabs
             else:
                 sql = self.schema_box.toPlainText()
                 self.db_manager.cursor.execute(sql)
                 self.db_manager.conn.commit()
+                self.db_manager.invalidate_metadata()
                 QMessageBox.information(self, "Success", "Table created")
                 self.table_changed.emit()  # Notify other tabs
-            self.db_manager.metadata_cache.clear()
             self.refresh_tables()
-            self.original_fields = self.fields.copy()
         except RuntimeError as e:
-            logging.error(f"Failed to apply changes due to lock: {str(e)}")
+            logger.error("Failed to apply changes due to lock: %s", e)
             QMessageBox.warning(self, "Database Busy", str(e))
         except sqlite3.Error as e:
-            logging.error(f"Failed to apply changes: {str(e)}")
+            logger.error("Failed to apply changes: %s", e)
             QMessageBox.critical(self, "Error",
                                  f"Failed to apply changes: {str(e)}. Ensure foreign key references are valid.")
             self.db_manager.conn.rollback()
         except Exception as e:
-            logging.error(f"Unexpected error during apply_changes: {str(e)}")
+            logger.error("Unexpected error during apply_changes: %s", e)
             QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
             self.db_manager.conn.rollback()
 
     def closeEvent(self, event):
-        if self.fields != self.original_fields:
+        if self._fields_dirty:
             reply = QMessageBox.warning(self, "Unsaved Changes",
                                         "You have unsaved changes. Save them?",
                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No |
@@ -804,15 +1317,161 @@ class SchemaEditor(QWidget):
         else:
             event.accept()
 
+# ----------------------
+# BulkWorker (CSV import/export and Data Browser saves off the GUI thread)
+# ----------------------
+class BulkWorker(QObject):
+    """Runs CSV import/export and Data Browser saves on a worker thread, each job on its own SQLite connection."""
+    CHUNK = 10000  # Rows per executemany call / per progress report
+
+    progress = pyqtSignal(int)  # Rows processed so far
+    finished = pyqtSignal(str)  # Success message
+    cancelled = pyqtSignal(str)  # The job stopped on request; what was kept (if anything)
+    failed = pyqtSignal(str)  # Error message
+
+    def __init__(self):
+        super().__init__()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Ask the running job to stop; safe to call from the GUI thread."""
+        self._cancel.set()
+
+    @staticmethod
+    def _connect(db_path, synchronous):
+        # sqlite3 connections are bound to the creating thread, so the worker opens its own
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA busy_timeout=8000")
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def do_import(self, db_path, synchronous, file_path, table_name, columns):
+        """Insert the CSV rows into `columns`, which are the CSV header names in file order."""
+        self._cancel.clear()
+        column_names = ", ".join(quote_ident(c) for c in columns)
+        placeholders = ", ".join(["?" for _ in columns])
+        query = f'INSERT INTO {quote_ident(table_name)} ({column_names}) VALUES ({placeholders})'
+        conn = None
+        try:
+            conn = self._connect(db_path, synchronous)
+            with open(file_path, 'r', encoding='utf-8-sig') as f:
+                reader = csv.reader(f)
+                next(reader, None)  # Header already checked by ImportExportTab
+                # One transaction for the whole file, fed in fixed-size chunks so memory stays bounded
+                conn.execute("BEGIN IMMEDIATE")
+                done = 0
+                # The INSERT lists the header's columns in file order, so well-formed rows go in as parsed;
+                # only ragged rows are padded with NULL or trimmed
+                width = len(columns)
+                pad = [None] * width
+                while True:
+                    rows = [row if len(row) == width else row[:width] if len(row) > width else row + pad[len(row):]
+                            for row in islice(reader, self.CHUNK)]
+                    if not rows:
+                        break
+                    if self._cancel.is_set():
+                        conn.rollback()
+                        self.cancelled.emit(f"Import into {table_name} cancelled; no rows were written")
+                        return
+                    conn.executemany(query, rows)
+                    done += len(rows)
+                    self.progress.emit(done)
+                conn.commit()
+            if done >= self.CHUNK:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")  # Don't leave a large import's WAL on disk
+            self.finished.emit(f"Imported data into {table_name}")
+        except sqlite3.IntegrityError as e:
+            logger.error("Failed to import from CSV: %s", e)
+            self.failed.emit(f"Failed to import: {str(e)}. Ensure foreign key values are valid.")
+        except Exception as e:
+            logger.error("Failed to import from CSV: %s", e)
+            self.failed.emit(f"Failed to import: {str(e)}")
+        finally:
+            if conn:
+                conn.close()  # Rolls back anything left open by an error
+
+    def do_save(self, db_path, synchronous, table_name, steps):
+        """Run `steps` [(sql, rows, key_fill)] as one transaction, one executemany each; progress counts steps.
+
+        key_fill is None or (max_sql, pk_idx): blank keys at pk_idx are numbered on from max_sql's result first.
+        """
+        self._cancel.clear()
+        conn = None
+        try:
+            conn = self._connect(db_path, synchronous)
+            conn.execute("BEGIN IMMEDIATE")
+            for done, (query, rows, key_fill) in enumerate(steps, 1):
+                if self._cancel.is_set():
+                    conn.rollback()
+                    self.cancelled.emit(f"Saving {table_name} cancelled; nothing was written")
+                    return
+                if key_fill:
+                    # Read inside the transaction, so no other writer can take the same numbers
+                    max_sql, pk_idx = key_fill
+                    next_id = (conn.execute(max_sql).fetchone()[0] or 0) + 1
+                    for values in rows:
+                        if not values[pk_idx].strip():
+                            values[pk_idx] = str(next_id)
+                            next_id += 1
+                conn.executemany(query, rows)
+                logger.info("Saved %s row(s) with %s", len(rows), query)
+                self.progress.emit(done)
+            conn.commit()
+            self.finished.emit("Changes saved successfully")
+        except Exception as e:
+            logger.error("Failed to save changes: %s", e)
+            self.failed.emit(f"Failed to save changes: {str(e)}")
+        finally:
+            if conn:
+                conn.close()
+
+    def do_export(self, db_path, synchronous, file_path, table_name):
+        self._cancel.clear()
+        conn = None
+        try:
+            conn = self._connect(db_path, synchronous)
+            cursor = conn.execute(f'SELECT * FROM {quote_ident(table_name)}')
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow([d[0] for d in cursor.description])
+                done = 0
+                while True:
+                    rows = cursor.fetchmany(self.CHUNK)
+                    if not rows:
+                        break
+                    if self._cancel.is_set():
+                        break
+                    writer.writerows(rows)
+                    done += len(rows)
+                    self.progress.emit(done)
+            if self._cancel.is_set():
+                os.remove(file_path)
+                self.cancelled.emit(f"Export of {table_name} cancelled")
+            else:
+                self.finished.emit(f"Exported {table_name} to {file_path}")
+        except Exception as e:
+            logger.error("Failed to export to CSV: %s", e)
+            self.failed.emit(f"Failed to export: {str(e)}")
+        finally:
+            if conn:
+                conn.close()
+
 # ----------------------
 # ImportExportTab
 # ----------------------
 class ImportExportTab(QWidget):
     """Widget for importing and exporting table data."""
+    import_requested = pyqtSignal(str, str, str, str, list)  # db_path, synchronous, file_path, table_name, columns
+    export_requested = pyqtSignal(str, str, str, str)  # db_path, synchronous, file_path, table_name
+
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
+        self._progress = None
+        self._verb = ""
         self.init_ui()
+        self._start_worker()
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -824,16 +1483,67 @@ class ImportExportTab(QWidget):
         layout.addLayout(table_layout)
 
         button_layout = QHBoxLayout()
-        export_btn = QPushButton("Export to CSV")
-        export_btn.clicked.connect(self.export_to_csv)
-        button_layout.addWidget(export_btn)
-        import_btn = QPushButton("Import CSV")
-        import_btn.clicked.connect(self.import_from_csv)
-        button_layout.addWidget(import_btn)
+        self.export_btn = QPushButton("Export to CSV")
+        self.export_btn.clicked.connect(self.export_to_csv)
+        button_layout.addWidget(self.export_btn)
+        self.import_btn = QPushButton("Import CSV")
+        self.import_btn.clicked.connect(self.import_from_csv)
+        button_layout.addWidget(self.import_btn)
         layout.addLayout(button_layout)
 
         self.refresh_tables()
 
+    def _start_worker(self):
+        # One long-lived thread; jobs are queued to it through the *_requested signals
+        self._worker_thread = QThread(self)
+        self._worker = BulkWorker()
+        self._worker.moveToThread(self._worker_thread)
+        self._worker_thread.finished.connect(self._worker.deleteLater)
+        self.import_requested.connect(self._worker.do_import)
+        self.export_requested.connect(self._worker.do_export)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.finished.connect(self._on_finished)
+        self._worker.cancelled.connect(self._on_finished)
+        self._worker.failed.connect(self._on_failed)
+        self._worker_thread.start()
+        QApplication.instance().aboutToQuit.connect(self.stop_worker)
+
+    def stop_worker(self):
+        """Cancel any running job and wait for the worker thread to exit."""
+        if self._worker_thread.isRunning():
+            self._worker.cancel()
+            self._worker_thread.quit()
+            self._worker_thread.wait()
+
+    def _begin_job(self, verb):
+        self._verb = verb
+        self.import_btn.setEnabled(False)
+        self.export_btn.setEnabled(False)
+        self._progress = QProgressDialog(f"{verb}...", "Cancel", 0, 0, self)
+        self._progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._progress.setMinimumDuration(500)
+        self._progress.canceled.connect(self._worker.cancel)
+
+    def _end_job(self):
+        if self._progress:
+            self._progress.canceled.disconnect()
+            self._progress.close()
+            self._progress = None
+        self.import_btn.setEnabled(True)
+        self.export_btn.setEnabled(True)
+
+    def _on_progress(self, rows):
+        if self._progress:
+            self._progress.setLabelText(f"{self._verb}: {rows} rows")
+
+    def _on_finished(self, message):
+        self._end_job()
+        QMessageBox.information(self, "Success", message)
+
+    def _on_failed(self, message):
+        self._end_job()
+        QMessageBox.critical(self, "Error", message)
+
     def refresh_tables(self):
         self.table_combo.clear()
         self.table_combo.addItem("Select Table")
@@ -850,19 +1560,8 @@ class ImportExportTab(QWidget):
             return
         file_path, _ = QFileDialog.getSaveFileName(self, "Export to CSV", "", "CSV Files (*.csv);;All Files (*)")
         if file_path:
-            try:
-                self.db_manager.cursor.execute(f'SELECT * FROM "{table_name}"')
-                rows = self.db_manager.cursor.fetchall()
-                info = self.db_manager.get_table_info(table_name)
-                columns = [col[1] for col in info["columns"]]
-                with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(columns)
-                    writer.writerows(rows)
-                QMessageBox.information(self, "Success", f"Exported {table_name} to {file_path}")
-            except Exception as e:
-                logging.error(f"Failed to export to CSV: {str(e)}")
-                QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
+            self._begin_job(f"Exporting {table_name}")
+            self.export_requested.emit(self.db_manager.db_path, self.db_manager.synchronous, file_path, table_name)
 
     def import_from_csv(self):
         table_name = self.table_combo.currentText()
@@ -872,54 +1571,52 @@ class ImportExportTab(QWidget):
         file_path, _ = QFileDialog.getOpenFileName(self, "Import CSV", "", "CSV Files (*.csv);;All Files (*)")
         if file_path:
             try:
-                info = self.db_manager.get_table_info(table_name)
-                columns = [col[1] for col in info["columns"]]
+                columns = set(self.db_manager.get_table_info(table_name)["column_names"])
                 with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.reader(f)
-                    header = next(reader, None)
-                    if header:
-                        header = [h.strip() for h in header]
-                        if header != columns[:len(header)]:
-                            QMessageBox.critical(self, "Error", "CSV column names do not match table columns")
-                            return
-                    for row in reader:
-                        values = [row[i] if i < len(row) else None for i in range(len(columns))]
-                        column_names = ", ".join(f'"{c}"' for c in columns)
-                        placeholders = ", ".join(["?" for _ in columns])
-                        query = f'INSERT INTO "{table_name}" ({column_names}) VALUES ({placeholders})'
-                        self.db_manager.cursor.execute(query, values)
-                self.db_manager.conn.commit()
-                QMessageBox.information(self, "Success", f"Imported data into {table_name}")
-                self.db_manager.metadata_cache.clear()
-            except RuntimeError as e:
-                logging.error(f"Failed to import from CSV due to lock: {str(e)}")
-                QMessageBox.warning(self, "Database Busy", str(e))
-            except sqlite3.IntegrityError as e:
-                logging.error(f"Failed to import from CSV: {str(e)}")
-                QMessageBox.critical(self, "Error", f"Failed to import: {str(e)}. Ensure foreign key values are valid.")
+                    header = next(csv.reader(f), None)
+                if not header:
+                    QMessageBox.critical(self, "Error", "CSV file has no header row")
+                    return
+                # Columns are matched by name, so the CSV may reorder them or leave some out (those get their defaults)
+                header = [h.strip() for h in header]
+                unknown = [h for h in header if h not in columns]
+                if unknown or len(set(header)) != len(header):
+                    QMessageBox.critical(self, "Error", "CSV column names do not match table columns"
+                                         + (f": {', '.join(unknown)}" if unknown else " (duplicate names)"))
+                    return
             except Exception as e:
-                logging.error(f"Failed to import from CSV: {str(e)}")
+                logger.error("Failed to import from CSV: %s", e)
                 QMessageBox.critical(self, "Error", f"Failed to import: {str(e)}")
-                self.db_manager.conn.rollback()
+                return
+            self._begin_job(f"Importing into {table_name}")
+            self.import_requested.emit(self.db_manager.db_path, self.db_manager.synchronous, file_path, table_name, header)
 
 # ----------------------
 # QueryEditor
 # ----------------------
 class QueryEditor(QWidget):
     """Widget for executing SQL queries with syntax checking."""
+    DISPLAY_LIMIT = 10000  # Result rows rendered into the output pane
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
+        self._last_valid = None  # Syntax state the text is currently coloured for
+        # Checks syntax once typing pauses instead of on every keystroke
+        self._syntax_timer = QTimer(self)
+        self._syntax_timer.setSingleShot(True)
+        self._syntax_timer.setInterval(150)
+        self._syntax_timer.timeout.connect(self.check_syntax)
         self.init_ui()
 
     def init_ui(self):
         layout = QHBoxLayout(self)
         self.query_input = QTextEdit()
-        self.query_input.textChanged.connect(self.check_syntax)
+        self.query_input.textChanged.connect(self._syntax_timer.start)
         layout.addWidget(self.query_input, 1)
 
         self.result_output = QTextEdit()
         self.result_output.setReadOnly(True)
+        self.result_output.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)  # One layout line per result row
         layout.addWidget(self.result_output, 1)
 
         execute_btn = QPushButton("Execute Query")
@@ -930,10 +1627,15 @@ class QueryEditor(QWidget):
         query = self.query_input.toPlainText().strip()
         if not query:
             self.query_input.setToolTip("")
+            self._last_valid = None
             return
+        valid = sqlite3.complete_statement(query)
+        if valid == self._last_valid:
+            return  # Colour and tooltip already match; skip the whole-document reformat
+        self._last_valid = valid
         try:
             self.query_input.blockSignals(True)
-            if not sqlite3.complete_statement(query):
+            if not valid:
                 fmt = QTextCharFormat()
                 fmt.setForeground(QColor("red"))
                 cursor = self.query_input.textCursor()
@@ -948,7 +1650,7 @@ class QueryEditor(QWidget):
                 cursor.setCharFormat(fmt)
                 self.query_input.setToolTip("Valid SQL statement.")
         except Exception as e:
-            logging.error(f"Syntax check failed: {str(e)}")
+            logger.error("Syntax check failed: %s", e)
             self.query_input.setToolTip(f"Syntax error: {str(e)}")
         finally:
             self.query_input.blockSignals(False)
@@ -962,41 +1664,346 @@ class QueryEditor(QWidget):
             if not sqlite3.complete_statement(query):
                 QMessageBox.critical(self, "Error", "Invalid SQL syntax. Please correct the query.")
                 return
-            self.db_manager.cursor.execute(query)
-            results = self.db_manager.cursor.fetchall()
+            if _WRITE_RE.match(query):
+                # Writes go through BEGIN IMMEDIATE with the busy retry; their output is at most a RETURNING list
+                results = self.db_manager.execute_query(query)
+            else:
+                cursor = self.db_manager.conn.cursor()
+                try:
+                    cursor.execute(query)
+                    # One row past the limit tells whether the result was cut off; the rest is never fetched
+                    results = cursor.fetchmany(self.DISPLAY_LIMIT + 1)
+                finally:
+                    cursor.close()  # Resets an unfinished SELECT so it does not pin a WAL snapshot
             if results:
-                output = "\n".join([str(row) for row in results])
-                self.result_output.setText(output)
+                # Tab-separated cells; NULL shows as an empty cell
+                text = "\n".join("\t".join("" if value is None else str(value) for value in row)
+                                 for row in islice(results, self.DISPLAY_LIMIT))
+                if len(results) > self.DISPLAY_LIMIT:
+                    text += f"\n... truncated after {self.DISPLAY_LIMIT} rows"
+                self.result_output.setPlainText(text)
             else:
-                self.result_output.setText("Query executed successfully. No results returned.")
+                self.result_output.setPlainText("Query executed successfully. No results returned.")
             self.db_manager.conn.commit()
+            if _DDL_RE.match(query):
+                self.db_manager.invalidate_metadata()
         except RuntimeError as e:
-            logging.error(f"Query execution failed due to lock: {str(e)}")
+            logger.error("Query execution failed due to lock: %s", e)
             QMessageBox.warning(self, "Database Busy", str(e))
         except sqlite3.Error as e:
-            logging.error(f"Query execution failed: {str(e)}")
+            logger.error("Query execution failed: %s", e)
             QMessageBox.critical(self, "Error", f"Query failed: {str(e)}")
         except Exception as e:
-            logging.error(f"Unexpected error in execute_query: {str(e)}")
+            logger.error("Unexpected error in execute_query: %s", e)
             QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
 
     def refresh_tables(self):
         pass
 
+# ----------------------
+# SqliteTableModel
+# ----------------------
+class NewRowKey:
+    """Key of an unsaved Data Browser row; equal only to itself, so it can never collide with a stored rowid."""
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<new row>"
+
+
+class SqliteTableModel(QAbstractTableModel):
+    """Table model over one page of `SELECT rowid, *` rows; rows are handed to the view in chunks through fetchMore."""
+    FETCH_CHUNK = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = []
+        self._rows = []  # Tuples as fetched: (rowid, col1, col2, ...); unsaved rows carry a NewRowKey
+        self._loaded = 0
+
+    def set_columns(self, columns):
+        self.beginResetModel()
+        self._columns = list(columns)
+        self._rows = []
+        self._loaded = 0
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(len(rows), self.FETCH_CHUNK)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(self.FETCH_CHUNK, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def fetch_all(self):
+        while self.canFetchMore():
+            self.fetchMore()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            value = self._rows[index.row()][index.column() + 1]
+            return str(value) if value is not None else ""
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()][0]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        if value == self.data(index, role):
+            return False
+        row = self._rows[index.row()]
+        col = index.column() + 1
+        self._rows[index.row()] = row[:col] + (value,) + row[col + 1:]
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section] if 0 <= section < len(self._columns) else None
+        return section + 1
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsEditable
+
+    def rowid(self, row):
+        return self._rows[row][0] if 0 <= row < len(self._rows) else None
+
+    def display_rows(self):
+        """The loaded rows as DisplayRole texts, in one pass without per-cell index()/data() calls."""
+        return [["" if value is None else str(value) for value in row[1:]] for row in self._rows[:self._loaded]]
+
+    def append_blank_row(self, key):
+        self.fetch_all()
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append((key,) + ("",) * len(self._columns))
+        self._loaded += 1
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._loaded -= 1
+        self.endRemoveRows()
+
+def _filter_operator(text):
+    """A trailing * asks for a prefix match, anything else is a case-insensitive substring search."""
+    return "GLOB" if len(text) > 1 and text.endswith("*") else "LIKE"
+
+
+def _filter_pattern(text):
+    if _filter_operator(text) == "GLOB":
+        # GLOB 'abc*' is case-sensitive, but SQLite turns it into a range seek on an ordinary (BINARY) index
+        return re.sub(r"([*?\[])", r"[\1]", text[:-1]) + "*"
+    return f"%{text}%"
+
+
+@lru_cache(maxsize=64)
+def _build_page_queries(table_name, filter_columns, sort_column, descending):
+    """Build the COUNT and paged SELECTs for one table/filter/sort shape; filter_columns holds (column, operator) pairs.
+
+    Returns (count_sql, offset_sql, seek_sql, seek_null_sql, counted_sql). The seek forms continue after a page
+    boundary (sort value, rowid) instead of skipping rows with OFFSET; seek_null_sql is used when the boundary value
+    is NULL. counted_sql is offset_sql with a trailing COUNT(*) OVER () column carrying the filtered total.
+    Equal shapes always produce identical SQL text, so sqlite3's statement cache reuses the compiled programs.
+    """
+    filters = [f'{quote_ident(column)} {operator} ?' for column, operator in filter_columns]
+    where = " WHERE " + " AND ".join(filters) if filters else ""
+    count_sql = f'SELECT COUNT(*) FROM {quote_ident(table_name)}{where}'
+    select = f'SELECT rowid, * FROM {quote_ident(table_name)}'
+    if sort_column is None:
+        order = " ORDER BY rowid"
+        seek = seek_null = "rowid > ?"
+    else:
+        col = quote_ident(sort_column)
+        # rowid breaks ties so every row has exactly one place in the order; NULLs sort first ASC, last DESC
+        if descending:
+            order = f" ORDER BY {col} DESC, rowid DESC"
+            seek = f"({col} < ? OR ({col} = ? AND rowid < ?) OR {col} IS NULL)"
+            seek_null = f"({col} IS NULL AND rowid < ?)"
+        else:
+            order = f" ORDER BY {col}, rowid"
+            seek = f"({col} > ? OR ({col} = ? AND rowid > ?))"
+            seek_null = f"({col} IS NOT NULL OR rowid > ?)"
+    offset_sql = f"{select}{where}{order} LIMIT ? OFFSET ?"
+    counted_sql = f'SELECT rowid, *, COUNT(*) OVER () FROM {quote_ident(table_name)}{where}{order} LIMIT ? OFFSET ?'
+    seek_sql, seek_null_sql = (f"{select} WHERE {' AND '.join(filters + [predicate])}{order} LIMIT ?"
+                               for predicate in (seek, seek_null))
+    return count_sql, offset_sql, seek_sql, seek_null_sql, counted_sql
+
+# ----------------------
+# PageLoader (Data Browser page queries off the GUI thread)
+# ----------------------
+class PageSignals(QObject):
+    """Lives on the GUI thread, so PageTask results are delivered there."""
+    loaded = pyqtSignal(int, object, object)  # request id, filtered total (None if not counted), rows
+    failed = pyqtSignal(int, str)  # request id, error message
+
+
+class PageLoader:
+    """Owns the Data Browser's read-only connection; a one-thread pool runs its queries one at a time."""
+
+    def __init__(self):
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(1)
+        self.signals = PageSignals()
+        self._conn = None
+        self._db_path = None
+
+    def submit(self, request_id, db_path, sql, params, count=None):
+        """Run `sql` for request_id; with count=(count_sql, params), sql is counted_sql and the total comes back too."""
+        self.pool.start(PageTask(self, request_id, db_path, sql, params, count))
+
+    def interrupt(self):
+        """Abort the query in flight, e.g. one superseded by a newer request; safe from the GUI thread."""
+        conn = self._conn
+        if conn:
+            conn.interrupt()
+
+    def connection(self, db_path):
+        # Only ever used by one task at a time, although the pool may hand it to a fresh thread
+        if self._db_path != db_path:
+            self.release_connection()
+            self._conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False,
+                                         cached_statements=256)
+            self._conn.execute("PRAGMA busy_timeout=8000")
+            self._conn.execute("PRAGMA mmap_size=268435456")
+            self._db_path = db_path
+        return self._conn
+
+    def release_connection(self):
+        if self._conn:
+            self._conn.close()
+        self._conn = self._db_path = None
+
+    def close(self):
+        """Wait for the running query and drop the connection (database closed, schema changed or app exit)."""
+        self.interrupt()
+        self.pool.waitForDone()
+        self.release_connection()
+
+
+class PageTask(QRunnable):
+    """One Data Browser page query on PageLoader's connection."""
+
+    def __init__(self, loader, request_id, db_path, sql, params, count):
+        super().__init__()
+        self.loader = loader
+        self.request_id = request_id
+        self.db_path = db_path
+        self.sql = sql
+        self.params = params
+        self.count = count
+
+    def run(self):
+        try:
+            cursor = self.loader.connection(self.db_path).cursor()
+            try:
+                rows = cursor.execute(self.sql, self.params).fetchall()
+                total = None
+                if self.count:
+                    if rows:
+                        total = rows[0][-1]
+                        rows = [row[:-1] for row in rows]
+                    else:
+                        # Past the last page (e.g. after deletes) the window has no row to report on
+                        total = cursor.execute(*self.count).fetchone()[0]
+                        rows = None
+            finally:
+                cursor.close()
+        except Exception as e:
+            self.loader.signals.failed.emit(self.request_id, str(e))
+            return
+        self.loader.signals.loaded.emit(self.request_id, total, rows)
+
 # ----------------------
 # DataBrowser
 # ----------------------
 class DataBrowser(QWidget):
     """Widget for browsing and editing table data with pagination."""
+    DELETE_CHUNK = 500
+    save_requested = pyqtSignal(str, str, str, list)  # db_path, synchronous, table_name, BulkWorker.do_save steps
+
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
+        self._progress = None
         self.sort_states = {}
         self.filters = {}
         self.current_page = 1
         self.page_size = 1000
         self.total_rows = 0
+        # COUNT(*) results per (table, filter query); valid only while the database change stamp is unchanged
+        self._count_cache = {}
+        self._count_stamp = None
+        # Keyset paging: page number -> (sort value, rowid) of the row just before that page
+        self._page_keys = {}
+        self._page_keys_shape = None
+        # Coalesces filter keystrokes, sort clicks and page-size spins so only the last change within 200 ms queries the database
+        self._requery_timer = QTimer(self)
+        self._requery_timer.setSingleShot(True)
+        self._requery_timer.setInterval(200)
+        self._requery_timer.timeout.connect(self._run_requery)
+        # Report documents are built on the thread pool; (TableReport, preview) while one is in flight
+        self._report = None
+        self._report_signals = ReportSignals()
+        self._report_signals.built.connect(self._on_report_built)
+        self._report_signals.failed.connect(self._on_report_failed)
+        # Page queries run on PageLoader's thread; _page_request describes the one whose result is still wanted
+        self._pages = PageLoader()
+        self._pages.signals.loaded.connect(self._on_page_loaded)
+        self._pages.signals.failed.connect(self._on_page_failed)
+        self._page_request = None
+        self._page_request_id = 0
         self.init_ui()
+        self._start_worker()
+
+    def _start_worker(self):
+        # Saves run on their own thread and connection, so a long batch does not freeze the window
+        self._worker_thread = QThread(self)
+        self._worker = BulkWorker()
+        self._worker.moveToThread(self._worker_thread)
+        self._worker_thread.finished.connect(self._worker.deleteLater)
+        self.save_requested.connect(self._worker.do_save)
+        self._worker.progress.connect(self._on_save_progress)
+        self._worker.finished.connect(self._on_save_finished)
+        self._worker.cancelled.connect(self._on_save_cancelled)
+        self._worker.failed.connect(self._on_save_failed)
+        self._worker_thread.start()
+        QApplication.instance().aboutToQuit.connect(self.stop_worker)
+
+    def stop_worker(self):
+        """Cancel a running save and wait for the worker thread to exit."""
+        if self._worker_thread.isRunning():
+            self._worker.cancel()
+            self._worker_thread.quit()
+            self._worker_thread.wait()
+        self._page_request = None
+        self._pages.close()
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -1011,10 +2018,17 @@ class DataBrowser(QWidget):
         self.filter_layout = QHBoxLayout(self.filter_widget)
         layout.addWidget(self.filter_widget)
 
-        self.data_table = QTableWidget()
-        self.data_table.setHorizontalHeaderLabels([])
+        self.model = SqliteTableModel(self)
+        self.model.dataChanged.connect(lambda top_left, *_: self.cell_changed(top_left.row(), top_left.column()))
+        self.data_table = QTableView()
+        self.data_table.setModel(self.model)
         self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.data_table.cellChanged.connect(self.cell_changed)
+        self.data_table.horizontalHeader().setSectionsClickable(True)
+        # Connected once here; reconnecting per table load stacked duplicate slots, each re-running the page query
+        self.data_table.horizontalHeader().setSortIndicatorShown(True)
+        self.data_table.horizontalHeader().sortIndicatorChanged.connect(self.sort_table)
+        # Fixed row heights: the view never has to measure row contents
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         layout.addWidget(self.data_table)
 
         controls_layout = QHBoxLayout()
@@ -1062,32 +2076,48 @@ class DataBrowser(QWidget):
         truncate_btn.clicked.connect(self.truncate_all)
         layout.addWidget(truncate_btn, alignment=Qt.AlignmentFlag.AlignRight)
 
-        self.changes = []  # Store (action, row_idx) or (action, rowid, col_idx, value)
+        # Unsaved edits as their net effect: NewRowKey -> row values, (rowid, col_idx) -> latest value, rowids.
+        # Each cell keeps one update, and removing a row drops its updates (or, if never saved, its insert).
+        self.pending = {"insert": {}, "update": {}, "delete": set()}
         self.refresh_tables()
 
     def _run_report(self, preview=True):
         if self.table_combo.currentText() == "Select Table":
             QMessageBox.information(self, "Report", "No table selected.")
             return
-        if not self.data_table.rowCount() or not self.data_table.columnCount():
+        if not self.model.rowCount() or not self.model.columnCount():
             QMessageBox.warning(self, "Warning", "Table data is not loaded. Please select a table and wait for data to load.")
             return
-        rep = TableReport(self.data_table, title=f"{self.table_combo.currentText()} – Page {self.current_page}")
+        if self._report is not None:
+            return  # The previous report is still being built
+        self.model.fetch_all()
+        rep = TableReport(self.model, title=f"{self.table_combo.currentText()} – Page {self.current_page}")
+        self._report = (rep, preview)
+        QThreadPool.globalInstance().start(ReportWorker(rep.title, *rep.snapshot(), self._report_signals))
+
+    def _on_report_built(self, doc):
+        rep, preview = self._report
+        self._report = None
         try:
             if preview:
-                rep.preview(self)
+                rep.preview(self, doc)
             else:
-                rep.print_(self)
+                rep.print_(self, doc)
         except Exception as e:
-            logging.error(f"Report error: {e}")
+            logger.error("Report error: %s", e)
             QMessageBox.critical(self, "Print Error", f"Failed to generate report: {str(e)}")
 
+    def _on_report_failed(self, message):
+        self._report = None
+        QMessageBox.critical(self, "Print Error", f"Failed to generate report: {message}")
+
     def refresh_tables(self):
+        # The database was closed or its schema changed: drop any page in flight and the loader's connection
+        self._page_request = None
+        self._pages.close()
         self.table_combo.clear()
-        self.data_table.clear()
-        self.data_table.setRowCount(0)
-        self.data_table.setColumnCount(0)
-        self.changes = []
+        self.model.set_columns([])
+        self.clear_pending()
         self.filters.clear()
         self.sort_states.clear()
         self.current_page = 1
@@ -1102,15 +2132,14 @@ class DataBrowser(QWidget):
         if self.db_manager.is_connected():
             tables = self.db_manager.get_tables()
             self.table_combo.addItems(tables)
-        logging.debug("Tables refreshed")
+        logger.debug("Tables refreshed")
 
     def load_table(self, table_name):
-        self.data_table.blockSignals(True)
-        self.data_table.clear()
-        self.data_table.setRowCount(0)
-        self.data_table.setColumnCount(0)
-        self.changes = []
+        self._cancel_page_load()  # A page of the previous table must not land in the new columns
+        self.model.set_columns([])
+        self.clear_pending()
         self.filters.clear()
+        self._requery_timer.stop()  # A pending filter belongs to the previous table
         self.sort_states.clear()
         self.current_page = 1
         for i in reversed(range(self.filter_layout.count())):
@@ -1122,38 +2151,29 @@ class DataBrowser(QWidget):
             self.page_label.setText(f"Page 1")
             self.prev_btn.setEnabled(False)
             self.next_btn.setEnabled(False)
-            self.data_table.blockSignals(False)
-            logging.debug("No table selected")
+            logger.debug("No table selected")
             return
         try:
-            info = self.db_manager.get_table_info(table_name)
-            columns = [col[1] for col in info["columns"]]
-            self.data_table.setColumnCount(len(columns))
-            self.data_table.setHorizontalHeaderLabels(columns)
-            headers = [self.data_table.horizontalHeaderItem(i).text() if self.data_table.horizontalHeaderItem(i) else f"Col{i}" for i in range(len(columns))]
-            logging.debug(f"load_table: Set {len(columns)} columns, headers={headers}")
+            columns = self.db_manager.get_table_info(table_name)["column_names"]
+            self.model.set_columns(columns)
+            logger.debug("load_table: Set %s columns, headers=%s", len(columns), columns)
             for col_idx in range(len(columns)):
                 filter_edit = QLineEdit()
                 filter_edit.setPlaceholderText(columns[col_idx])
                 filter_edit.textChanged.connect(lambda text, idx=col_idx: self.apply_filter(idx, text))
                 self.filter_layout.addWidget(filter_edit)
-            header = self.data_table.horizontalHeader()
-            header.setSortIndicatorShown(True)
-            header.sortIndicatorChanged.connect(self.sort_table)
             self.update_pagination(table_name)
         except sqlite3.Error as e:
-            logging.error(f"Failed to load table in DataBrowser: {str(e)}")
+            logger.error("Failed to load table in DataBrowser: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to load table: {str(e)}")
         except Exception as e:
-            logging.error(f"Unexpected error in load_table: {str(e)}")
+            logger.error("Unexpected error in load_table: %s", e)
             QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
-        finally:
-            self.data_table.blockSignals(False)
 
     def setup_filters_and_update(self, table_name, columns):
         try:
-            if self.data_table.columnCount() != len(columns):
-                logging.error(f"setup_filters_and_update: Column count mismatch, expected {len(columns)}, got {self.data_table.columnCount()}")
+            if self.model.columnCount() != len(columns):
+                logger.error("setup_filters_and_update: Column count mismatch, expected %s, got %s", len(columns), self.model.columnCount())
                 raise ValueError("Column count mismatch")
             self.filter_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
             while self.filter_layout.count() < len(columns):
@@ -1165,109 +2185,205 @@ class DataBrowser(QWidget):
                 widget = self.filter_layout.itemAt(self.filter_layout.count() - 1).widget()
                 if widget:
                     widget.deleteLater()
-            header = self.data_table.horizontalHeader()
-            header.setSortIndicatorShown(True)
-            header.sortIndicatorChanged.connect(self.sort_table)
-            logging.debug(f"setup_filters_and_update: Loaded table {table_name} with {len(columns)} columns")
+            logger.debug("setup_filters_and_update: Loaded table %s with %s columns", table_name, len(columns))
             self.update_pagination(table_name)
         except Exception as e:
-            logging.error(f"Error in setup_filters_and_update: {str(e)}")
+            logger.error("Error in setup_filters_and_update: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to set up filters: {str(e)}")
 
     def update_pagination(self, table_name):
+        """Refresh the total and the current page; the queries run on the PageLoader thread."""
         try:
-            query = f"SELECT COUNT(*) FROM \"{table_name}\""
-            params = []
-            column_count = self.data_table.columnCount()
-            logging.debug(f"update_pagination: Updating for {table_name}, column_count={column_count}, filters={self.filters}")
-            for col_idx in range(column_count):
-                filter_text = self.filters.get(col_idx, "")
-                if filter_text:
-                    if not params:
-                        query += " WHERE"
-                    else:
-                        query += " AND"
-                    header_item = self.data_table.horizontalHeaderItem(col_idx)
-                    if header_item and col_idx < column_count:
-                        query += f" \"{header_item.text()}\" LIKE ?"
-                        params.append(f"%{filter_text}%")
-                    else:
-                        logging.warning(f"update_pagination: Invalid header item or index {col_idx} for column count {column_count}, skipping filter")
-            self.db_manager.cursor.execute(query, params)
-            self.total_rows = self.db_manager.cursor.fetchone()[0]
-            if self.total_rows == 0:
-                self.page_label.setText("Page 0 of 0")
-                self.prev_btn.setEnabled(False)
-                self.next_btn.setEnabled(False)
-                self.data_table.setRowCount(0)
-                return
-            total_pages = max(1, (self.total_rows + self.page_size - 1) // self.page_size)
-            self.current_page = min(max(1, self.current_page), total_pages)
-            self.page_label.setText(f"Page {self.current_page} of {total_pages}")
-            self.prev_btn.setEnabled(self.current_page > 1)
-            self.next_btn.setEnabled(self.current_page < total_pages)
-            self.load_page(table_name)
+            logger.debug("update_pagination: Updating for %s, filters=%s", table_name, self.filters)
+            queries, params, _ = self._page_queries(table_name)
+            total = self._cached_count(table_name, queries[0], params)
+            if total is None:
+                # Page and filtered total from one scan (COUNT(*) OVER ()); the total is shown when it arrives
+                self._request_page(table_name, queries[4],
+                                   params + [self.page_size, (self.current_page - 1) * self.page_size],
+                                   count=(queries[0], params))
+            else:
+                self._show_total(table_name, total)
         except Exception as e:
-            logging.error(f"Error in update_pagination: {str(e)}")
+            logger.error("Error in update_pagination: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to update pagination: {str(e)}")
 
+    def _show_total(self, table_name, total, rows=None):
+        """Update the page label and buttons for `total`, then show `rows` or request the (clamped) current page."""
+        self.total_rows = total
+        if total == 0:
+            self.page_label.setText("Page 0 of 0")
+            self.prev_btn.setEnabled(False)
+            self.next_btn.setEnabled(False)
+            self._show_page([])  # Still lists unsaved new rows
+            return
+        total_pages = max(1, (total + self.page_size - 1) // self.page_size)
+        page = min(max(1, self.current_page), total_pages)
+        if page != self.current_page:
+            rows = None  # Fetched for a page that does not exist any more
+        self.current_page = page
+        self.page_label.setText(f"Page {self.current_page} of {total_pages}")
+        self.prev_btn.setEnabled(self.current_page > 1)
+        self.next_btn.setEnabled(self.current_page < total_pages)
+        if rows is None:
+            self.load_page(table_name)
+        else:
+            self._show_page(rows)
+
+    def _request_page(self, table_name, sql, params, count=None):
+        """Send a page query to the loader; any older request still in flight is interrupted and its result ignored."""
+        if self._page_request is not None:
+            self._pages.interrupt()
+        self._page_request_id += 1
+        _, _, sort_idx = self._page_queries(table_name)
+        # What the result belongs to, so a late answer can be matched (or discarded) on arrival
+        self._page_request = {"id": self._page_request_id, "table": table_name, "sort_idx": sort_idx,
+                              "shape": self._page_keys_shape, "page": self.current_page,
+                              "count_key": (table_name, count[0], tuple(count[1])) if count else None}
+        self._pages.submit(self._page_request_id, self.db_manager.db_path, sql, params, count)
+
+    def _cancel_page_load(self):
+        if self._page_request is not None:
+            self._page_request = None
+            self._pages.interrupt()
+
+    def _on_page_loaded(self, request_id, total, rows):
+        request = self._page_request
+        if request is None or request["id"] != request_id:
+            return  # Superseded by a newer request, or the table was switched meanwhile
+        self._page_request = None
+        if request["count_key"] is not None:
+            self._count_cache[request["count_key"]] = total
+            self._show_total(request["table"], total, rows)
+        else:
+            self._show_page(rows, request)
+
+    def _on_page_failed(self, request_id, message):
+        request = self._page_request
+        if request is None or request["id"] != request_id:
+            return  # An interrupted, superseded query
+        self._page_request = None
+        logger.error("Failed to load page: %s", message)
+        QMessageBox.critical(self, "Error", f"Failed to update pagination: {message}")
+
+    def _cached_count(self, table_name, query, params):
+        """Return the cached COUNT for these filters, or None if they or the table data changed since it was taken."""
+        stamp = self.db_manager.change_stamp()
+        if stamp != self._count_stamp:
+            self._count_cache.clear()
+            self._count_stamp = stamp
+        return self._count_cache.get((table_name, query, tuple(params)))
+
+    def _page_queries(self, table_name):
+        """Return (the _build_page_queries SQL, filter params, sort column index) for the current filters and sort."""
+        columns = self.db_manager.get_table_info(table_name)["column_names"]
+        # Column order keeps the SQL text stable for a given filter set
+        active = [(column, text) for col_idx, column in enumerate(columns) if (text := self.filters.get(col_idx))]
+        filter_columns = tuple((column, _filter_operator(text)) for column, text in active)
+        params = [_filter_pattern(text) for _, text in active]
+        header = self.data_table.horizontalHeader()
+        sort_col = header.sortIndicatorSection()
+        sort_column = columns[sort_col] if 0 <= sort_col < len(columns) else None
+        descending = header.sortIndicatorOrder() == Qt.SortOrder.DescendingOrder
+        queries = _build_page_queries(table_name, filter_columns, sort_column, descending)
+        return queries, params, sort_col if sort_column is not None else None
+
     def load_page(self, table_name):
-        info = self.db_manager.get_table_info(table_name)
-        columns = [col[1] for col in info["columns"]]
-        offset = (self.current_page - 1) * self.page_size
-        query = f"SELECT rowid, * FROM \"{table_name}\""
-        where_clauses = []
-        params = []
-        for col_idx in range(self.data_table.columnCount()):
-            filter_text = self.filters.get(col_idx, "")
-            if filter_text:
-                where_clauses.append(f"\"{columns[col_idx]}\" LIKE ?")
-                params.append(f"%{filter_text}%")
-        if where_clauses:
-            query += " WHERE " + " AND ".join(where_clauses)
-        sort_col = self.data_table.horizontalHeader().sortIndicatorSection()
-        sort_order = "DESC" if self.data_table.horizontalHeader().sortIndicatorOrder() == Qt.SortOrder.DescendingOrder else "ASC"
-        if sort_col >= 0 and sort_col < len(columns):
-            query += f" ORDER BY \"{columns[sort_col]}\" {sort_order}"
-        query += f" LIMIT ? OFFSET ?"
-        params.extend([self.page_size, offset])
-        self.db_manager.cursor.execute(query, params)
-        rows = self.db_manager.cursor.fetchall()
-        self.data_table.blockSignals(True)
-        self.data_table.setRowCount(len(rows))
-        for row_idx, row in enumerate(rows):
-            rowid = row[0]  # First column is rowid
-            for col_idx, value in enumerate(row[1:], 1):  # Skip rowid
-                item = QTableWidgetItem(str(value) if value is not None else "")
-                if col_idx == 1:
-                    item.setData(Qt.ItemDataRole.UserRole, rowid)
-                self.data_table.setItem(row_idx, col_idx - 1, item)
-        self.data_table.blockSignals(False)
-        logging.info(f"Loaded page {self.current_page} for {table_name} with {len(rows)} records")
+        """Request the current page, seeking from the previous page's last row where that boundary is known."""
+        (_, offset_sql, seek_sql, seek_null_sql, _), params, sort_idx = self._page_queries(table_name)
+        self._sync_page_keys(offset_sql, params)
+        key = self._page_keys.get(self.current_page)
+        if key is None:
+            # First page, or a page not reached by stepping (e.g. after a page-size change): fall back to OFFSET
+            query = offset_sql
+            params += [self.page_size, (self.current_page - 1) * self.page_size]
+        else:
+            value, rowid = key
+            if sort_idx is None or value is None:
+                query = seek_null_sql
+                params.append(rowid)
+            else:
+                query = seek_sql
+                params += [value, value, rowid]
+            params.append(self.page_size)
+        self._request_page(table_name, query, params)
+
+    def _sync_page_keys(self, offset_sql, params):
+        # Page start boundaries are only valid for one query shape, filter text and page size
+        shape = (offset_sql, tuple(params), self.page_size)
+        if shape != self._page_keys_shape:
+            self._page_keys = {}
+            self._page_keys_shape = shape
+
+    def _show_page(self, rows, request=None):
+        """Put fetched page rows into the model, remembering where the next page starts."""
+        request = request or {}
+        table_name = self.table_combo.currentText()
+        if request.get("table", table_name) == table_name:
+            (_, offset_sql, *_), params, sort_idx = self._page_queries(table_name)
+            self._sync_page_keys(offset_sql, params)
+            if len(rows) == self.page_size and request.get("shape", self._page_keys_shape) == self._page_keys_shape:
+                # Remember where the next page starts, so Next/Previous seek instead of skipping rows
+                last = rows[-1]
+                page = request.get("page", self.current_page)
+                self._page_keys[page + 1] = (last[sort_idx + 1] if sort_idx is not None else None, last[0])
+        if any(self.pending.values()):
+            rows = self._with_pending(rows)
+        self.model.set_rows(rows)  # First column of each row is rowid
+        logger.info("Loaded page %s for %s with %s records", self.current_page, table_name, len(rows))
+
+    def _with_pending(self, rows):
+        """Show unsaved edits on a freshly loaded page: hide pending deletes, overlay updates, append new rows."""
+        updates = {}
+        for (rowid, col_idx), value in self.pending["update"].items():
+            updates.setdefault(rowid, {})[col_idx] = value
+        shown = []
+        for row in rows:
+            if row[0] in self.pending["delete"]:
+                continue
+            if row[0] in updates:
+                row = list(row)
+                for col_idx, value in updates[row[0]].items():
+                    row[col_idx + 1] = value
+                row = tuple(row)
+            shown.append(row)
+        shown.extend((key, *values) for key, values in self.pending["insert"].items())
+        return shown
+
+    def has_pending_changes(self):
+        return any(self.pending.values())
+
+    def clear_pending(self):
+        self.pending = {"insert": {}, "update": {}, "delete": set()}
 
     def apply_filter(self, col_idx, text):
-        if col_idx < self.data_table.columnCount():
+        if col_idx < self.model.columnCount():
             self.filters[col_idx] = text if text else None
             self.current_page = 1
-            table_name = self.table_combo.currentText()
-            if table_name and table_name != "Select Table":
-                self.update_pagination(table_name)
+            self._requery_timer.start()
         else:
-            logging.warning(f"Invalid filter index {col_idx} for column count {self.data_table.columnCount()}")
+            logger.warning("Invalid filter index %s for column count %s", col_idx, self.model.columnCount())
 
-    def sort_table(self, logical_index, order):
-        self.current_page = 1
+    def _run_requery(self):
         table_name = self.table_combo.currentText()
         if table_name and table_name != "Select Table":
             self.update_pagination(table_name)
 
+    def sort_table(self, logical_index, order):
+        self.current_page = 1
+        self._requery_timer.start()  # Quick header clicks (ASC, then DESC) settle into one query
+
     def next_page(self):
+        if self.current_page * self.page_size >= self.total_rows:
+            return  # Already on the last page; re-querying would only clamp back to it
         self.current_page += 1
         table_name = self.table_combo.currentText()
         if table_name and table_name != "Select Table":
             self.update_pagination(table_name)
 
     def prev_page(self):
+        if self.current_page <= 1:
+            return
         self.current_page -= 1
         table_name = self.table_combo.currentText()
         if table_name and table_name != "Select Table":
@@ -1276,135 +2392,132 @@ class DataBrowser(QWidget):
     def set_page_size(self, size):
         self.page_size = size
         self.current_page = 1
-        table_name = self.table_combo.currentText()
-        if table_name and table_name != "Select Table":
-            self.update_pagination(table_name)
+        self._requery_timer.start()  # Typing "2500" or holding an arrow would otherwise reload once per step
 
     def add_row(self):
         table_name = self.table_combo.currentText()
         if table_name == "Select Table":
             QMessageBox.critical(self, "Error", "Select a table")
             return
-        row_count = self.data_table.rowCount()
-        self.data_table.blockSignals(True)
-        self.data_table.insertRow(row_count)
-        for col_idx in range(self.data_table.columnCount()):
-            self.data_table.setItem(row_count, col_idx, QTableWidgetItem(""))
-        self.data_table.blockSignals(False)
-        self.changes.append(("insert", row_count))
-        logging.info(f"Added row at index {row_count} for {table_name}")
+        key = NewRowKey()
+        self.pending["insert"][key] = [""] * self.model.columnCount()
+        row = self.model.append_blank_row(key)
+        logger.info("Added row at index %s for %s", row, table_name)
 
     def remove_row(self):
         table_name = self.table_combo.currentText()
         if table_name == "Select Table":
             QMessageBox.critical(self, "Error", "Select a table")
             return
-        selected_rows = self.data_table.selectedIndexes()
+        # Rows from the selection ranges: any selected cell marks its row, without one index per selected cell
+        selected_rows = {row for sel in self.data_table.selectionModel().selection()
+                         for row in range(sel.top(), sel.bottom() + 1)}
         if not selected_rows:
             QMessageBox.warning(self, "Warning", "Select a row to remove")
             return
 
-        try:
-            self.data_table.blockSignals(True)
-            for row_idx in sorted({i.row() for i in selected_rows}, reverse=True):
-                item = self.data_table.item(row_idx, 0)
-                rowid = item.data(Qt.ItemDataRole.UserRole) if item else None
-                if rowid is not None:
-                    self.db_manager.cursor.execute(f'DELETE FROM "{table_name}" WHERE rowid = ?', (rowid,))
-                    self.changes.append(("delete", rowid))
-                    logging.info(f"Scheduled deletion of rowid {rowid} from {table_name}")
-                else:
-                    self.data_table.removeRow(row_idx)
-                    self.changes.append(("delete", row_idx))
-                    logging.info(f"Removed unsaved row at index {row_idx} from {table_name}")
-            self.db_manager.conn.commit()
-            self.update_pagination(table_name)
-        except sqlite3.Error as e:
-            logging.error(f"Failed to remove row from {table_name}: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to remove row: {str(e)}")
-            self.db_manager.conn.rollback()
-        finally:
-            self.data_table.blockSignals(False)
+        deleted = self.pending["delete"]
+        for row_idx in sorted(selected_rows, reverse=True):
+            rowid = self.model.rowid(row_idx)
+            self.model.remove_row(row_idx)
+            if isinstance(rowid, NewRowKey):
+                del self.pending["insert"][rowid]  # Never saved, so there is nothing to delete
+                logger.info("Removed unsaved row at index %s from %s", row_idx, table_name)
+            else:
+                deleted.add(rowid)
+                logger.info("Scheduled deletion of rowid %s from %s", rowid, table_name)
+        self.pending["update"] = {key: value for key, value in self.pending["update"].items()
+                                  if key[0] not in deleted}
 
     def cell_changed(self, row, col):
         table_name = self.table_combo.currentText()
         if table_name != "Select Table" and row >= 0:
-            item = self.data_table.item(row, col)
-            value = item.text() if item else ""
-            item = self.data_table.item(row, 0)
-            rowid = item.data(Qt.ItemDataRole.UserRole) if item else None
-            self.changes.append(("update", rowid, col, value))
-            logging.info(f"Cell changed at row {row}, col {col} for {table_name}, rowid={rowid}, value={value}")
+            value = self.model.index(row, col).data()
+            rowid = self.model.rowid(row)
+            if isinstance(rowid, NewRowKey):
+                self.pending["insert"][rowid][col] = value
+            else:
+                self.pending["update"][(rowid, col)] = value
+            logger.info("Cell changed at row %s, col %s for %s, rowid=%s, value=%s", row, col, table_name, rowid, value)
 
     def save_changes(self):
         table_name = self.table_combo.currentText()
-        if table_name == "Select Table" or not self.changes:
+        if table_name == "Select Table" or not self.has_pending_changes() or self._progress:
             return
 
-        progress = QProgressDialog("Saving changes...", "Cancel", 0, len(self.changes), self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
+        info = self.db_manager.get_table_info(table_name)
+        columns, pk_col, pk_idx = info["column_names"], info["pk_col"], info["pk_idx"]
+
+        # One statement per bucket (per edited column set for updates). Deletes go first, so a new row may reuse a freed key
+        deletes = sorted(self.pending["delete"])
+        steps = []
+        for start in range(0, len(deletes), self.DELETE_CHUNK):
+            # One IN (...) statement per chunk, kept under SQLite's bound-parameter limit
+            chunk = deletes[start:start + self.DELETE_CHUNK]
+            steps.append((f'DELETE FROM {quote_ident(table_name)} WHERE rowid IN ({", ".join("?" * len(chunk))})', [chunk], None))
+        # A row with several edited cells gets one multi-column SET (one b-tree descent); rows with the same
+        # column set share a statement
+        row_edits = {}
+        for (rowid, col_idx), value in self.pending["update"].items():
+            row_edits.setdefault(rowid, {})[col_idx] = value
+        updates = {}
+        for rowid, edits in row_edits.items():
+            col_set = tuple(sorted(edits))
+            updates.setdefault(col_set, []).append([edits[col_idx] for col_idx in col_set] + [rowid])
+        steps += [(f'UPDATE {quote_ident(table_name)} SET {", ".join(f"{quote_ident(columns[c])} = ?" for c in col_set)} '
+                   f'WHERE rowid = ?', params, None)
+                  for col_set, params in updates.items()]
+        # Copies: key numbering must not leak into the pending rows if the save is cancelled or fails
+        insert_rows = [list(values) for values in self.pending["insert"].values()]
+        if insert_rows:
+            key_fill = None
+            if info["rowid_pk"]:
+                # NULL lets SQLite assign the key (honouring AUTOINCREMENT), no MAX() needed
+                for values in insert_rows:
+                    if not values[pk_idx].strip():
+                        values[pk_idx] = None
+            elif pk_idx >= 0 and any(not values[pk_idx].strip() for values in insert_rows):
+                # One MAX() for the whole batch; the worker numbers blank keys on from there
+                key_fill = (f'SELECT MAX({quote_ident(pk_col)}) FROM {quote_ident(table_name)}', pk_idx)
+            column_names = ", ".join(quote_ident(c) for c in columns)
+            placeholders = ", ".join(["?" for _ in columns])
+            steps.append((f'INSERT INTO {quote_ident(table_name)} ({column_names}) VALUES ({placeholders})', insert_rows, key_fill))
+
+        self._progress = QProgressDialog("Saving changes...", "Cancel", 0, len(steps), self)
+        self._progress.setWindowModality(Qt.WindowModality.WindowModal)  # No edits while the batch is in flight
+        # Shown at once: a delayed dialog would leave the grid editable, and _on_save_finished clears all pending edits
+        self._progress.setMinimumDuration(0)
+        self._progress.show()
+        self._progress.canceled.connect(self._worker.cancel)
+        self.save_requested.emit(self.db_manager.db_path, self.db_manager.synchronous, table_name, steps)
+
+    def _end_save(self):
+        if self._progress:
+            self._progress.canceled.disconnect()
+            self._progress.close()
+            self._progress = None
+
+    def _on_save_progress(self, done):
+        if self._progress:
+            self._progress.setValue(done)
+
+    def _on_save_finished(self, message):
+        self._end_save()
+        self.clear_pending()
+        table_name = self.table_combo.currentText()
+        if table_name and table_name != "Select Table":
+            self.update_pagination(table_name)
+        QMessageBox.information(self, "Success", message)
 
-        try:
-            self.db_manager.conn.execute("BEGIN TRANSACTION")
-            info = self.db_manager.get_table_info(table_name)
-            columns = [col[1] for col in info["columns"]]
-            pk_col = next((col[1] for col in info["columns"] if col[5]), None)
-            pk_idx = columns.index(pk_col) if pk_col else -1
-
-            for i, change in enumerate(self.changes):
-                if progress.wasCanceled():
-                    self.db_manager.conn.rollback()
-                    raise RuntimeError("Save operation cancelled")
-                progress.setValue(i)
-
-                if change[0] == "insert":
-                    row_idx = change[1]
-                    values = [self.data_table.item(row_idx, c).text() if self.data_table.item(row_idx, c) else "" for c in range(self.data_table.columnCount())]
-                    if pk_idx >= 0 and not values[pk_idx].strip():
-                        self.db_manager.cursor.execute(f'SELECT MAX("{pk_col}") FROM "{table_name}"')
-                        max_id = self.db_manager.cursor.fetchone()[0]
-                        values[pk_idx] = str((max_id or 0) + 1) if max_id is not None else "1"
-                    column_names = ", ".join(f'"{c}"' for c in columns)
-                    placeholders = ", ".join(["?" for _ in columns])
-                    query = f'INSERT INTO "{table_name}" ({column_names}) VALUES ({placeholders})'
-                    self.db_manager.cursor.execute(query, values)
-                    logging.info(f"Inserted row at index {row_idx} with values {values}")
-
-                elif change[0] == "update":
-                    _, rowid, col_idx, value = change
-                    if rowid:
-                        column_name = columns[col_idx]
-                        query = f'UPDATE "{table_name}" SET "{column_name}" = ? WHERE rowid = ?'
-                        self.db_manager.cursor.execute(query, (value, rowid))
-                        logging.info(f"Updated rowid {rowid}, column {column_name} to {value}")
-
-                elif change[0] == "delete":
-                    _, rowid = change
-                    if isinstance(rowid, int):
-                        query = f'DELETE FROM "{table_name}" WHERE rowid = ?'
-                        self.db_manager.cursor.execute(query, (rowid,))
-                        logging.info(f"Deleted rowid {rowid}")
+    def _on_save_cancelled(self, message):
+        # Rolled back; the edits stay pending so the user can save again
+        self._end_save()
+        logger.error("Save operation cancelled: %s", message)
+        QMessageBox.warning(self, "Cancelled", message)
 
-            self.db_manager.conn.commit()
-            self.changes.clear()
-            self.update_pagination(table_name)
-            progress.setValue(len(self.changes))
-            QMessageBox.information(self, "Success", "Changes saved successfully")
-        except RuntimeError as e:
-            logging.error(f"Save operation cancelled: {str(e)}")
-            QMessageBox.warning(self, "Cancelled", str(e))
-            self.db_manager.conn.rollback()
-        except sqlite3.Error as e:
-            logging.error(f"Failed to save changes: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to save changes: {str(e)}")
-            self.db_manager.conn.rollback()
-        except Exception as e:
-            logging.error(f"Unexpected error in save_changes: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Unexpected error: {str(e)}")
-            self.db_manager.conn.rollback()
-        finally:
-            progress.close()
+    def _on_save_failed(self, message):
+        self._end_save()
+        QMessageBox.critical(self, "Error", message)
 
     def truncate_all(self):
         table_name = self.table_combo.currentText()
@@ -1416,14 +2529,17 @@ class DataBrowser(QWidget):
                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                self.db_manager.cursor.execute(f'DELETE FROM "{table_name}"')
-                self.db_manager.conn.commit()
+                # An unqualified DELETE frees the table's pages wholesale (SQLite's truncate optimization) unless
+                # the table has triggers or, with foreign_keys on, is referenced by a foreign key; then each row
+                # is visited so those still fire and are enforced. DROP + CREATE would skip both, so it is not used.
+                # The connection's secure_delete setting is honoured, so deleted rows are zeroed if it asks for that
+                with self.db_manager.transaction() as cursor:
+                    cursor.execute(f'DELETE FROM {quote_ident(table_name)}')
                 self.update_pagination(table_name)
                 QMessageBox.information(self, "Success", f"All data from {table_name} deleted")
             except sqlite3.Error as e:
-                logging.error(f"Failed to truncate table {table_name}: {str(e)}")
+                logger.error("Failed to truncate table %s: %s", table_name, e)
                 QMessageBox.critical(self, "Error", f"Failed to truncate table: {str(e)}")
-                self.db_manager.conn.rollback()
 
 # ----------------------
 # SQLiteEditor
@@ -1449,6 +2565,14 @@ class SQLiteEditor(QMainWindow):
         close_action = QAction("Close DB", self)
         close_action.triggered.connect(self.close_db)
         file_menu.addAction(close_action)
+        backup_action = QAction("Backup DB...", self)
+        backup_action.triggered.connect(self.backup_db)
+        file_menu.addAction(backup_action)
+        durable_action = QAction("Durable Commits (synchronous=FULL)", self)
+        durable_action.setCheckable(True)
+        durable_action.setChecked(self.db_manager.synchronous == "FULL")
+        durable_action.toggled.connect(self.db_manager.set_synchronous)
+        file_menu.addAction(durable_action)
         file_menu.addSeparator()
         exit_action = QAction("Exit", self)
         exit_action.triggered.connect(self.close)
@@ -1481,38 +2605,38 @@ class SQLiteEditor(QMainWindow):
         self.schema_tab.table_changed.connect(self.imp_tab.refresh_tables)
 
     def _ensure_discard_changes(self) -> bool:
-        if hasattr(self.browser_tab, "changes") and self.browser_tab.changes:
+        if hasattr(self.browser_tab, "pending") and self.browser_tab.has_pending_changes():
             if QMessageBox.question(self, "Unsaved", "Discard unsaved changes?",
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.No:
                 return False
         return True
 
     def create_db(self, checked=False) -> bool:
-        logging.debug("Starting create_db")
+        logger.debug("Starting create_db")
         if not self._ensure_discard_changes():
-            logging.debug("create_db cancelled due to unsaved changes")
+            logger.debug("create_db cancelled due to unsaved changes")
             return False
         fp, _ = QFileDialog.getSaveFileName(self, "Create DB", "", "SQLite (*.db *.sqlite *.sqlite3)")
         if fp:
-            logging.debug(f"Creating database: {fp}")
+            logger.debug("Creating database: %s", fp)
             if self.db_manager.connect(fp):
                 self.db_label.setText(os.path.basename(fp))
                 self._refresh_timer.start(100)
-                logging.info(f"Database created: {fp}")
+                logger.info("Database created: %s", fp)
                 return True
             else:
-                logging.error(f"Failed to create database: {fp}")
+                logger.error("Failed to create database: %s", fp)
                 return False
         return False
 
     def open_db(self, checked=False) -> bool:
-        logging.debug("Starting open_db")
+        logger.debug("Starting open_db")
         if not self._ensure_discard_changes():
-            logging.debug("open_db cancelled due to unsaved changes")
+            logger.debug("open_db cancelled due to unsaved changes")
             return False
         fp, _ = QFileDialog.getOpenFileName(self, "Open database", "", "SQLite (*.db *.sqlite *.sqlite3)")
         if fp:
-            logging.debug(f"Opening database: {fp}")
+            logger.debug("Opening database: %s", fp)
             prog = QProgressDialog("Opening database...", None, 0, 0, self)
             prog.setWindowModality(Qt.WindowModality.WindowModal)
             prog.show()
@@ -1521,27 +2645,54 @@ class SQLiteEditor(QMainWindow):
                 if self.db_manager.connect(fp):
                     self.db_label.setText(os.path.basename(fp))
                     self._refresh_timer.start(100)
-                    logging.info(f"Database opened: {fp}")
+                    logger.info("Database opened: %s", fp)
                     return True
                 else:
-                    logging.error(f"Failed to open database: {fp}")
+                    logger.error("Failed to open database: %s", fp)
                     return False
             finally:
                 prog.close()
         return False
 
+    def backup_db(self, checked=False) -> bool:
+        if not self.db_manager.is_connected():
+            QMessageBox.warning(self, "Warning", "No database is open.")
+            return False
+        fp, _ = QFileDialog.getSaveFileName(self, "Backup database", "", "SQLite (*.db *.sqlite *.sqlite3)")
+        if not fp:
+            return False
+        prog = QProgressDialog("Backing up database...", None, 0, 0, self)
+        prog.setWindowModality(Qt.WindowModality.WindowModal)
+        prog.show()
+
+        def on_progress(done, total):
+            prog.setMaximum(total)
+            prog.setValue(done)
+            QApplication.processEvents()
+
+        try:
+            self.db_manager.backup_database(fp, on_progress)
+        except (sqlite3.Error, ValueError) as e:
+            logger.error("Database backup failed: %s", e)
+            QMessageBox.critical(self, "Error", f"Backup failed: {str(e)}")
+            return False
+        finally:
+            prog.close()
+        QMessageBox.information(self, "Success", f"Database backed up to {fp}")
+        return True
+
     def close_db(self, checked=False) -> bool:
-        logging.debug("Starting close_db")
+        logger.debug("Starting close_db")
         if not self._ensure_discard_changes():
-            logging.debug("close_db cancelled due to unsaved changes")
+            logger.debug("close_db cancelled due to unsaved changes")
             return False
 
         self._refresh_timer.stop()
-        logging.debug("Refresh timer stopped")
+        logger.debug("Refresh timer stopped")
 
         self.db_manager.close()
         self.db_label.setText("No DB")
-        logging.info("Database connection closed")
+        logger.info("Database connection closed")
 
         if self.schema_tab:
             self.schema_tab.refresh_tables()
@@ -1555,9 +2706,9 @@ class SQLiteEditor(QMainWindow):
         return True
 
     def _deferred_refresh_tabs(self):
-        logging.debug("Starting deferred tab refresh")
+        logger.debug("Starting deferred tab refresh")
         if not self.db_manager.is_connected():
-            logging.debug("No database connected, skipping tab refresh")
+            logger.debug("No database connected, skipping tab refresh")
             return
 
         prog = QProgressDialog("Refreshing tabs...", None, 0, 4, self)
@@ -1566,39 +2717,41 @@ class SQLiteEditor(QMainWindow):
         QApplication.processEvents()
         try:
             prog.setValue(1)
-            logging.debug("Refreshing Schema tab")
+            logger.debug("Refreshing Schema tab")
             if self.schema_tab:
                 self.schema_tab.refresh_tables()
             prog.setValue(2)
-            logging.debug("Refreshing DataBrowser tab")
+            logger.debug("Refreshing DataBrowser tab")
             if self.browser_tab:
                 self.browser_tab.refresh_tables()
             prog.setValue(3)
-            logging.debug("Refreshing ImportExport tab")
+            logger.debug("Refreshing ImportExport tab")
             if self.imp_tab:
                 self.imp_tab.refresh_tables()
             prog.setValue(4)
-            logging.debug("Tab refresh completed")
+            logger.debug("Tab refresh completed")
         except Exception as e:
-            logging.error(f"Error during tab refresh: {str(e)}")
+            logger.error("Error during tab refresh: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to refresh tabs: {str(e)}")
         finally:
             prog.close()
 
     def closeEvent(self, ev):
-        logging.debug("Handling closeEvent")
+        logger.debug("Handling closeEvent")
         if self._ensure_discard_changes():
             self._refresh_timer.stop()
+            self.imp_tab.stop_worker()
+            self.browser_tab.stop_worker()
             self.db_manager.close()
-            logging.info("Application closed cleanly")
+            logger.info("Application closed cleanly")
             ev.accept()
         else:
             ev.ignore()
-            logging.debug("Close event ignored due to unsaved changes")
+            logger.debug("Close event ignored due to unsaved changes")
 
 def log_method_entry(func):
     def wrapper(*args, **kwargs):
-        logging.debug(f"Entering {func.__name__}")
+        logger.debug("Entering %s", func.__name__)
         return func(*args, **kwargs)
     return wrapper
 